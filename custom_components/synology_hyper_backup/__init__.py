@@ -2,22 +2,41 @@
 
 from __future__ import annotations
 
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING
-from functools import partial
 
-from homeassistant.components.synology_dsm.const import DOMAIN as SYNOLOGY_DOMAIN
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryNotReady
-from synology_api.core_backup import Backup
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
 
+from .api import SessionProvider, SynologyHyperBackupApi
 from .const import (
     CONF_API,
     CONF_COORDINATOR,
+    CONF_IMPORT_HISTORY,
+    CONF_INCLUDE_KEYS,
+    CONF_STATUS_COORDINATOR,
+    CONF_WATCH_LOG,
     CONFIG_DSM_ENTRY_ID,
+    DATA_FLEET,
+    DEFAULT_IMPORT_HISTORY,
+    DEFAULT_WATCH_LOG,
     DOMAIN,
+    FLEET_MAX_CONCURRENT_REQUESTS,
+    FLEET_STAGGER_INTERVAL,
+    LOG_TAIL_INTERVAL,
     LOGGER,
     PLATFORMS,
+    STORAGE_SAVE_DELAY,
+    STORAGE_VERSION,
+    SYNOLOGY_DSM_DOMAIN,
 )
-from .coordinator import SynologyTasksCoordinator
+from .coordinator import SynologyTaskStatusCoordinator, SynologyTasksCoordinator
+from .history import BackupHistoryImporter, history_store
+from .scheduler import FleetScheduler
+from .services import async_setup_services
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -28,54 +47,177 @@ if TYPE_CHECKING:
 async def async_setup(hass: HomeAssistant, _: ConfigType) -> bool:
     """Set up the Synology Tasks component."""
     hass.data.setdefault(DOMAIN, {})
+    hass.data.setdefault(
+        DATA_FLEET,
+        FleetScheduler(FLEET_MAX_CONCURRENT_REQUESTS, FLEET_STAGGER_INTERVAL),
+    )
+    async_setup_services(hass)
     return True
 
 
+def _snapshot_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the last coordinator data of the entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
+def _dsm_session_provider(dsm_entry: ConfigEntry) -> SessionProvider:
+    """Return a provider of the session held by the synology_dsm integration."""
+
+    def _session() -> tuple[str, str | None] | None:
+        # The core integration does not expose its session; look it up
+        # defensively so a change on its side only costs us our own login.
+        dsm = getattr(getattr(dsm_entry, "runtime_data", None), "api", None)
+        dsm = getattr(dsm, "dsm", None)
+        if not isinstance(sid := getattr(dsm, "_session_id", None), str):
+            return None
+        return sid, getattr(dsm, "_syno_token", None)
+
+    return _session
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Synology Tasks from a config entry."""
     try:
         # Get synology_dsm entry to create the SynologyDSM client.
         dsm_entry = next(
             e
-            for e in hass.config_entries.async_entries(SYNOLOGY_DOMAIN)
+            for e in hass.config_entries.async_entries(SYNOLOGY_DSM_DOMAIN)
             if e.entry_id == entry.data.get(CONFIG_DSM_ENTRY_ID)
         )
+    except StopIteration as err:
+        raise ConfigEntryNotReady from err
 
-        synology_backup = await hass.async_add_executor_job(
-            partial(
-                Backup,
-                ip_address=dsm_entry.data.get("host"),
-                port=dsm_entry.data.get("port"),
-                username=dsm_entry.data.get("username"),
-                password=dsm_entry.data.get("password"),
-                secure=dsm_entry.data.get("ssl", True),
-                cert_verify=dsm_entry.data.get("verify_ssl", True),
-                dsm_version=7,
+    # Reuses Home Assistant's shared aiohttp session and the DSM session of
+    # the synology_dsm integration; nothing is requested until the first
+    # refresh, and we only log in ourselves if that session is unusable.
+    api = SynologyHyperBackupApi(
+        async_get_clientsession(hass, dsm_entry.data.get("verify_ssl", True)),
+        host=dsm_entry.data.get("host"),
+        port=dsm_entry.data.get("port"),
+        username=dsm_entry.data.get("username"),
+        password=dsm_entry.data.get("password"),
+        secure=dsm_entry.data.get("ssl", True),
+        session_provider=_dsm_session_provider(dsm_entry),
+    )
+    fleet: FleetScheduler = hass.data[DATA_FLEET]
+    coordinator = SynologyTasksCoordinator(hass, entry, api, fleet)
+    status_coordinator = SynologyTaskStatusCoordinator(hass, entry, coordinator)
+    store = _snapshot_store(hass, entry)
+    stagger = fleet.register(entry.entry_id)
+    entry.async_on_unload(lambda: fleet.unregister(entry.entry_id))
+
+    if snapshot := await store.async_load():
+        # Create the entities from the last known data right away and let the
+        # NAS catch up in the background, so a slow NAS does not delay startup.
+        coordinator.async_restore(snapshot[CONF_COORDINATOR])
+        status_coordinator.async_restore(snapshot[CONF_STATUS_COORDINATOR])
+
+        async def _async_refresh() -> None:
+            await coordinator.async_refresh()
+            await status_coordinator.async_refresh()
+
+        @callback
+        def _async_start_refresh(_now: datetime) -> None:
+            entry.async_create_background_task(
+                hass, _async_refresh(), f"{DOMAIN} {entry.entry_id} first refresh"
             )
-        )
 
-        coordinator = SynologyTasksCoordinator(hass, synology_backup)
-        await coordinator.async_config_entry_first_refresh()
-    except Exception as err:
-        raise ConfigEntryNotReady from err
+        # Entries refresh in stagger slots, so the polls of a fleet of NASes
+        # restored at startup keep apart instead of firing together.
+        entry.async_on_unload(async_call_later(hass, stagger, _async_start_refresh))
+    else:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+            await status_coordinator.async_config_entry_first_refresh()
+        except Exception as err:
+            raise ConfigEntryNotReady from err
 
     hass.data[DOMAIN][entry.entry_id] = {
         CONF_COORDINATOR: coordinator,
-        CONF_API: synology_backup,
+        CONF_STATUS_COORDINATOR: status_coordinator,
+        CONF_API: api,
     }
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    @callback
+    def _async_save_snapshot() -> None:
+        """Persist the latest task data of both coordinators."""
+        store.async_delay_save(
+            lambda: {
+                CONF_COORDINATOR: {"task_list": coordinator.data["task_list"]},
+                CONF_STATUS_COORDINATOR: {
+                    "task_list": status_coordinator.data["task_list"]
+                },
+            },
+            STORAGE_SAVE_DELAY,
+        )
+
+    entry.async_on_unload(coordinator.async_add_listener(_async_save_snapshot))
+    entry.async_on_unload(status_coordinator.async_add_listener(_async_save_snapshot))
+    entry.async_on_unload(
+        coordinator.async_add_listener(status_coordinator.async_handle_tasks_update)
+    )
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
+    if entry.options.get(CONF_WATCH_LOG, DEFAULT_WATCH_LOG):
+        entry.async_on_unload(
+            async_track_time_interval(
+                hass,
+                status_coordinator.async_check_log_tail,
+                timedelta(seconds=LOG_TAIL_INTERVAL),
+                name=f"{DOMAIN} {entry.entry_id} log tail",
+                cancel_on_shutdown=True,
+            )
+        )
+
+    if entry.options.get(CONF_IMPORT_HISTORY, DEFAULT_IMPORT_HISTORY) and (
+        "recorder" in hass.config.components
+    ):
+        importer = BackupHistoryImporter(hass, entry, coordinator)
+        await importer.async_load()
+
+        @callback
+        def _async_import_history() -> None:
+            """Import the backup runs of the hours finished since the last poll."""
+            if coordinator.last_update_success and importer.is_due():
+                entry.async_create_background_task(
+                    hass, importer.async_import(), f"{DOMAIN} {entry.entry_id} history"
+                )
+
+        entry.async_on_unload(coordinator.async_add_listener(_async_import_history))
+
+    return True
+
+
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate a config entry to the current version."""
+    if entry.version == 1:
+        # Entries created before the key allowlist had a sensor for every key;
+        # keep them, rather than applying the narrow default to them.
+        hass.config_entries.async_update_entry(
+            entry, options={CONF_INCLUDE_KEYS: ["*"], **entry.options}, version=2
+        )
+        LOGGER.debug("Migrated config entry %s to version 2", entry.entry_id)
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload the config entry when its options change."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    logout_result = await hass.async_add_executor_job(
-        hass.data[DOMAIN][entry.entry_id][CONF_API].logout
-    )
+    await hass.data[DOMAIN][entry.entry_id][CONF_API].async_logout()
     if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
         hass.data[DOMAIN].pop(entry.entry_id)
 
-    return logout_result and unload_ok
+    return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot and history watermark of a removed entry."""
+    await _snapshot_store(hass, entry).async_remove()
+    await history_store(hass, entry).async_remove()
@@ -0,0 +1,448 @@
+"""Async client for the Synology Hyper Backup web API."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any, NamedTuple
+
+import aiohttp
+
+from .const import LATENCY_BUCKETS, LOGGER
+from .utils import LatencyStats
+
+API_INFO = "SYNO.API.Info"
+API_AUTH = "SYNO.API.Auth"
+API_BACKUP_TASK = "SYNO.Backup.Task"
+API_BACKUP_TARGET = "SYNO.Backup.Target"
+API_BACKUP_LOG = "SYNO.SDS.Backup.Client.Common.Log"
+API_ENTRY_REQUEST = "SYNO.Entry.Request"
+
+# APIs whose path and version are looked up once per client
+QUERIED_APIS = (
+    API_AUTH,
+    API_BACKUP_TASK,
+    API_BACKUP_TARGET,
+    API_BACKUP_LOG,
+    API_ENTRY_REQUEST,
+)
+
+AUTH_VERSION = 6
+REQUEST_TIMEOUT = 30  # seconds
+
+# Error codes DSM returns for a timed out, logged out or otherwise invalid
+# session id
+SESSION_EXPIRED_CODES = frozenset({106, 107, 119})
+# Permission denied; a borrowed session may lack the rights of our own login
+PERMISSION_DENIED_CODE = 105
+
+# Returns the session id and SynoToken of an already logged in DSM client,
+# or None if it has no session
+SessionProvider = Callable[[], tuple[str, str | None] | None]
+
+
+class ApiCall(NamedTuple):
+    """
+    A single API method call with its parameters as native values; they
+    are JSON encoded for a query string, but sent as they are inside a
+    SYNO.Entry.Request compound request.
+    """
+
+    api: str
+    method: str
+    params: dict[str, Any]
+
+
+def backup_task_list_call() -> ApiCall:
+    """Build the call listing the Hyper Backup tasks."""
+    return ApiCall(API_BACKUP_TASK, "list", {})
+
+
+def backup_task_status_call(task_id: int) -> ApiCall:
+    """Build the call getting the status and state of a task."""
+    return ApiCall(API_BACKUP_TASK, "status", {"task_id": task_id})
+
+
+def backup_task_result_call(task_id: int) -> ApiCall:
+    """Build the call getting the last result summary of a task."""
+    return ApiCall(
+        API_BACKUP_TASK,
+        "status",
+        {
+            "blOnline": False,
+            "additional": [
+                "last_bkp_time",
+                "next_bkp_time",
+                "last_bkp_result",
+                "is_modified",
+                "last_bkp_progress",
+            ],
+            "task_id": task_id,
+        },
+    )
+
+
+def backup_task_run_call(task_id: int) -> ApiCall:
+    """Build the call starting a backup of a task."""
+    return ApiCall(API_BACKUP_TASK, "backup", {"task_id": task_id})
+
+
+def backup_task_cancel_call(task_id: int) -> ApiCall:
+    """Build the call cancelling the running backup of a task."""
+    return ApiCall(
+        API_BACKUP_TASK, "cancel", {"task_id": task_id, "task_state": "backupable"}
+    )
+
+
+def integrity_check_run_call(task_id: int) -> ApiCall:
+    """Build the call starting an integrity check of a task's target."""
+    return ApiCall(
+        API_BACKUP_TARGET,
+        "error_detect",
+        {
+            "task_id": task_id,
+            "detect_data": True,
+            "sessId": None,
+            "sessKey": None,
+        },
+    )
+
+
+def integrity_check_cancel_call(task_id: int) -> ApiCall:
+    """Build the call cancelling the running integrity check of a task."""
+    return ApiCall(API_BACKUP_TARGET, "error_detect_cancel", {"task_id": task_id})
+
+
+def hb_logs_get_call(
+    limit: int = 1000,
+    offset: int = 0,
+    filter_keyword: str = "",
+    filter_date_from: int = 0,
+    filter_date_to: int = 0,
+) -> ApiCall:
+    """Build the call getting Hyper Backup log rows, newest first."""
+    return ApiCall(
+        API_BACKUP_LOG,
+        "list",
+        {
+            "limit": limit,
+            "offset": offset,
+            "filter_keyword": filter_keyword,
+            "filter_date_from": filter_date_from,
+            "filter_date_to": filter_date_to,
+        },
+    )
+
+
+def _query_params(params: dict[str, Any]) -> dict[str, str]:
+    """Encode call parameters for a query string, the way DSM decodes them."""
+    return {
+        key: value if isinstance(value, str) else json.dumps(value)
+        for key, value in params.items()
+    }
+
+
+class SynologyApiError(Exception):
+    """Error returned by the DSM web API."""
+
+    def __init__(self, api: str, code: int | None) -> None:
+        """Initialize the error."""
+        super().__init__(f"{api} request failed with error code {code}")
+        self.api = api
+        self.code = code
+
+
+class SynologyAuthError(SynologyApiError):
+    """Error logging in to DSM."""
+
+
+class SynologyHyperBackupApi:
+    """Hyper Backup endpoints over a shared aiohttp session with keep-alive."""
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        secure: bool = True,
+        session_provider: SessionProvider | None = None,
+    ) -> None:
+        """
+        Initialize the client; nothing is requested until the first call.
+        When a session_provider is given, its session is reused instead of
+        logging in, falling back to our own login once DSM rejects it.
+        """
+        self._session = session
+        self._base_url = f"{'https' if secure else 'http'}://{host}:{port}/webapi/"
+        self._username = username
+        self._password = password
+        self._apis: dict[str, dict[str, Any]] = {}
+        self._sid: str | None = None
+        self._syno_token: str | None = None
+        self._session_provider = session_provider
+        # Whether _sid is our own login, which we log out of on unload
+        self._owns_session = False
+        # Borrowed session ids DSM rejected, so they are not borrowed again
+        self._rejected_sids: set[str] = set()
+        self._login_lock = asyncio.Lock()
+        # Request stats per endpoint ("<api>.<method>")
+        self.stats: dict[str, LatencyStats] = {}
+
+    async def _async_get(self, path: str, params: dict[str, Any]) -> dict:
+        """Perform a GET request and return the decoded JSON payload."""
+        return await self._async_send("GET", path, params=params)
+
+    async def _async_send(self, method: str, path: str, **kwargs: Any) -> dict:
+        """Perform a request and return the decoded JSON payload."""
+        request = kwargs.get("params") or kwargs.get("data") or {}
+        endpoint = f"{request.get('api')}.{request.get('method')}"
+        headers = {"X-SYNO-TOKEN": self._syno_token} if self._syno_token else None
+        start = time.monotonic()
+        try:
+            async with self._session.request(
+                method,
+                f"{self._base_url}{path}",
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT),
+                **kwargs,
+            ) as response:
+                response.raise_for_status()
+                body = await response.read()
+            payload = json.loads(body)
+        except Exception:
+            self._record(endpoint, time.monotonic() - start, failed=True)
+            raise
+        self._record(
+            endpoint,
+            time.monotonic() - start,
+            len(body),
+            failed=not payload.get("success"),
+        )
+        return payload
+
+    def _record(
+        self, endpoint: str, latency: float | None, size: int = 0, failed: bool = False
+    ) -> None:
+        """Record a request in the stats of its endpoint."""
+        if (stats := self.stats.get(endpoint)) is None:
+            stats = self.stats[endpoint] = LatencyStats(LATENCY_BUCKETS)
+        stats.record(latency, size, failed)
+
+    async def _async_query_apis(self) -> None:
+        """Look up the path and versions of the APIs used by the client."""
+        payload = await self._async_get(
+            "query.cgi",
+            {
+                "api": API_INFO,
+                "version": 1,
+                "method": "query",
+                "query": ",".join(QUERIED_APIS),
+            },
+        )
+        if not payload.get("success"):
+            raise SynologyApiError(API_INFO, payload.get("error", {}).get("code"))
+        self._apis = payload["data"]
+
+    async def async_login(self) -> None:
+        """Borrow or log in to a session, unless already logged in."""
+        async with self._login_lock:
+            if self._sid is not None:
+                return
+            if not self._apis:
+                await self._async_query_apis()
+            if (
+                self._session_provider is not None
+                and (shared := self._session_provider()) is not None
+                and shared[0] not in self._rejected_sids
+            ):
+                self._sid, self._syno_token = shared
+                self._owns_session = False
+                LOGGER.debug("Reusing the session of the Synology DSM integration")
+                return
+            payload = await self._async_get(
+                self._apis[API_AUTH]["path"],
+                {
+                    "api": API_AUTH,
+                    "version": AUTH_VERSION,
+                    "method": "login",
+                    "account": self._username,
+                    "passwd": self._password,
+                    # Needed for non-administrator users to use the API.
+                    "session": "webui",
+                    "format": "sid",
+                    "enable_syno_token": "yes",
+                },
+            )
+            if not payload.get("success"):
+                raise SynologyAuthError(API_AUTH, payload.get("error", {}).get("code"))
+            self._sid = payload["data"]["sid"]
+            self._syno_token = payload["data"].get("synotoken")
+            self._owns_session = True
+
+    async def async_logout(self) -> None:
+        """Log out of our own session; a borrowed session is only dropped."""
+        if self._sid is None or not self._owns_session:
+            self._sid = None
+            self._syno_token = None
+            return
+        try:
+            await self._async_get(
+                self._apis[API_AUTH]["path"],
+                {
+                    "api": API_AUTH,
+                    "version": AUTH_VERSION,
+                    "method": "logout",
+                    "session": "webui",
+                    "_sid": self._sid,
+                },
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            LOGGER.debug("Logging out of DSM failed: %s", err)
+        self._sid = None
+        self._syno_token = None
+
+    def _is_session_rejected(self, code: int | None) -> bool:
+        """Return True if an error code means the session must be replaced."""
+        return code in SESSION_EXPIRED_CODES or (
+            code == PERMISSION_DENIED_CODE and not self._owns_session
+        )
+
+    async def _async_send_authenticated(
+        self,
+        send: Callable[[], Awaitable[dict]],
+        error_codes: Callable[[dict], list[int | None]],
+    ) -> dict:
+        """
+        Send a request with the current session and return its payload.
+        If DSM rejects the session, log in again and retry once, so an
+        expired session does not fail the refresh.
+        """
+        await self.async_login()
+        sid = self._sid
+        payload = await send()
+        if not any(self._is_session_rejected(code) for code in error_codes(payload)):
+            return payload
+
+        LOGGER.debug("DSM rejected the session, logging in again")
+        async with self._login_lock:
+            # Concurrent requests share the session; only the first one to
+            # notice drops it.
+            if self._sid == sid:
+                if not self._owns_session:
+                    self._rejected_sids.add(sid)
+                self._sid = None
+                self._syno_token = None
+        await self.async_login()
+        return await send()
+
+    @property
+    def supports_compound(self) -> bool:
+        """Return True if DSM accepts SYNO.Entry.Request compound requests."""
+        return API_ENTRY_REQUEST in self._apis
+
+    async def async_request(self, call: ApiCall) -> dict:
+        """Call an API method and return its payload, raising on DSM errors."""
+        await self.async_login()
+        info = self._apis[call.api]
+        payload = await self._async_send_authenticated(
+            lambda: self._async_get(
+                info["path"],
+                {
+                    "api": call.api,
+                    "version": info["minVersion"],
+                    "method": call.method,
+                    **_query_params(call.params),
+                    "_sid": self._sid,
+                },
+            ),
+            lambda payload: [payload.get("error", {}).get("code")],
+        )
+        if not payload.get("success"):
+            raise SynologyApiError(call.api, payload.get("error", {}).get("code"))
+        return payload
+
+    async def async_request_compound(self, calls: list[ApiCall]) -> list[dict]:
+        """
+        Run several calls in one SYNO.Entry.Request HTTP request.
+        Returns one payload per call, shaped like the payload of a single
+        request; failed calls are returned with success False, not raised.
+        """
+        await self.async_login()
+        info = self._apis[API_ENTRY_REQUEST]
+        compound = json.dumps(
+            [
+                {
+                    "api": call.api,
+                    "method": call.method,
+                    "version": self._apis[call.api]["minVersion"],
+                    **call.params,
+                }
+                for call in calls
+            ]
+        )
+        payload = await self._async_send_authenticated(
+            lambda: self._async_send(
+                "POST",
+                info["path"],
+                data={
+                    "api": API_ENTRY_REQUEST,
+                    "version": info["maxVersion"],
+                    "method": "request",
+                    "mode": "sequential",
+                    "stop_when_error": "false",
+                    "compound": compound,
+                    "_sid": self._sid,
+                },
+            ),
+            lambda payload: [
+                result.get("error", {}).get("code")
+                for result in [payload, *payload.get("data", {}).get("result", [])]
+            ],
+        )
+        if not payload.get("success"):
+            raise SynologyApiError(
+                API_ENTRY_REQUEST, payload.get("error", {}).get("code")
+            )
+        results = payload.get("data", {}).get("result", [])
+        if len(results) != len(calls):
+            raise SynologyApiError(API_ENTRY_REQUEST, None)
+        # The batch is timed as a whole; count the calls it carried.
+        for call, result in zip(calls, results):
+            self._record(
+                f"{call.api}.{call.method}", None, failed=not result.get("success")
+            )
+        return [
+            {key: result[key] for key in ("success", "data", "error") if key in result}
+            for result in results
+        ]
+
+    async def async_backup_task_list(self) -> dict:
+        """Get the list of Hyper Backup tasks."""
+        return await self.async_request(backup_task_list_call())
+
+    async def async_backup_task_status(self, task_id: int) -> dict:
+        """Get the status and state of a task."""
+        return await self.async_request(backup_task_status_call(task_id))
+
+    async def async_backup_task_result(self, task_id: int) -> dict:
+        """Get the last result summary of a task."""
+        return await self.async_request(backup_task_result_call(task_id))
+
+    async def async_hb_logs_get(
+        self,
+        limit: int = 1000,
+        offset: int = 0,
+        filter_keyword: str = "",
+        filter_date_from: int = 0,
+        filter_date_to: int = 0,
+    ) -> dict:
+        """Get Hyper Backup log rows, newest first."""
+        return await self.async_request(
+            hb_logs_get_call(
+                limit, offset, filter_keyword, filter_date_from, filter_date_to
+            )
+        )
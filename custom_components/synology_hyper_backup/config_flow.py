@@ -5,24 +5,45 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
+import voluptuous as vol
+
 from homeassistant import config_entries
-from homeassistant.components.synology_dsm.const import DOMAIN as SYNOLOGY_DOMAIN
+from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import device_registry as dr, selector
 
 from .const import (
+    CONF_COMPOUND_REQUESTS,
+    CONF_EXCLUDE_KEYS,
+    CONF_IMPORT_HISTORY,
+    CONF_INCLUDE_KEYS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_SCAN_INTERVAL_ACTIVE,
+    CONF_SCAN_INTERVAL_IDLE,
+    CONF_WATCH_LOG,
     CONFIG_DEVICE_IDENTIFIERS,
     CONFIG_DEVICE_MANUFACTURER,
     CONFIG_DEVICE_MODEL,
     CONFIG_DEVICE_NAME,
     CONFIG_DEVICE_SW_VERSION,
     CONFIG_DSM_ENTRY_ID,
+    DEFAULT_COMPOUND_REQUESTS,
+    DEFAULT_IMPORT_HISTORY,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_SCAN_INTERVAL_ACTIVE,
+    DEFAULT_SCAN_INTERVAL_IDLE,
+    DEFAULT_WATCH_LOG,
     DOMAIN,
+    MAX_CONCURRENT_REQUESTS_LIMIT,
+    MIN_SCAN_INTERVAL,
     REASON_INVALID_DSM_ENTRY,
     REASON_NO_DSM_INSTANCES,
     REASON_UNKNOWN,
+    STEP_INIT,
     STEP_USER,
+    SYNOLOGY_DSM_DOMAIN,
 )
+from .key_overrides import DEFAULT_INCLUDE_KEYS
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
@@ -30,6 +51,35 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(
+            CONF_MAX_CONCURRENT_REQUESTS, default=DEFAULT_MAX_CONCURRENT_REQUESTS
+        ): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_CONCURRENT_REQUESTS_LIMIT)
+        ),
+        # Pack the per-task calls of a poll into SYNO.Entry.Request batches
+        vol.Optional(CONF_COMPOUND_REQUESTS, default=DEFAULT_COMPOUND_REQUESTS): bool,
+        vol.Optional(
+            CONF_SCAN_INTERVAL_ACTIVE, default=DEFAULT_SCAN_INTERVAL_ACTIVE
+        ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)),
+        vol.Optional(
+            CONF_SCAN_INTERVAL_IDLE, default=DEFAULT_SCAN_INTERVAL_IDLE
+        ): vol.All(vol.Coerce(int), vol.Range(min=MIN_SCAN_INTERVAL)),
+        # Check the Hyper Backup log often to notice finished runs quickly
+        vol.Optional(CONF_WATCH_LOG, default=DEFAULT_WATCH_LOG): bool,
+        # Import past backup runs from the log into long-term statistics
+        vol.Optional(CONF_IMPORT_HISTORY, default=DEFAULT_IMPORT_HISTORY): bool,
+        # Glob patterns selecting the task keys sensors are created for
+        vol.Optional(
+            CONF_INCLUDE_KEYS, default=DEFAULT_INCLUDE_KEYS
+        ): selector.TextSelector(selector.TextSelectorConfig(multiple=True)),
+        vol.Optional(CONF_EXCLUDE_KEYS, default=[]): selector.TextSelector(
+            selector.TextSelectorConfig(multiple=True)
+        ),
+    }
+)
+
 
 async def validate_user_input(hass: HomeAssistant, data: dict[str, Any]) -> None:
     """Validate that the synology_dsm entry exists and is working."""
@@ -37,7 +87,7 @@ async def validate_user_input(hass: HomeAssistant, data: dict[str, Any]) -> None
         dsm_entry := next(
             (
                 entry
-                for entry in hass.config_entries.async_entries(SYNOLOGY_DOMAIN)
+                for entry in hass.config_entries.async_entries(SYNOLOGY_DSM_DOMAIN)
                 if entry.entry_id == data[CONFIG_DSM_ENTRY_ID]
             ),
             None,
@@ -52,7 +102,16 @@ async def validate_user_input(hass: HomeAssistant, data: dict[str, Any]) -> None
 class SynologyTasksConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for Synology Tasks."""
 
-    VERSION = 1
+    # 2: entries start with the narrow default key allowlist
+    VERSION = 2
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> SynologyTasksOptionsFlow:
+        """Get the options flow for this handler."""
+        return SynologyTasksOptionsFlow()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -62,7 +121,7 @@ class SynologyTasksConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         # through the Home Assistant Core Synology DSM integration.
         dsm_entries = {
             entry.entry_id: entry.title
-            for entry in self.hass.config_entries.async_entries(SYNOLOGY_DOMAIN)
+            for entry in self.hass.config_entries.async_entries(SYNOLOGY_DSM_DOMAIN)
             if entry.state.recoverable
         }
 
@@ -76,11 +135,11 @@ class SynologyTasksConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return self.async_show_form(
                 step_id=STEP_USER,
                 data_schema=self.add_suggested_values_to_schema(
-                    config_entries.vol.Schema(
+                    vol.Schema(
                         {
-                            config_entries.vol.Required(
+                            vol.Required(
                                 CONFIG_DSM_ENTRY_ID
-                            ): config_entries.vol.In(dsm_entries),
+                            ): vol.In(dsm_entries),
                         }
                     ),
                     user_input or {},
@@ -121,6 +180,24 @@ class SynologyTasksConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
 
+class SynologyTasksOptionsFlow(config_entries.OptionsFlow):
+    """Handle Synology Tasks options."""
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the Synology Tasks options."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+
+        return self.async_show_form(
+            step_id=STEP_INIT,
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, self.config_entry.options
+            ),
+        )
+
+
 class InvalidDSMEntryError(HomeAssistantError):
     """Error to indicate the DSM entry is invalid."""
 
@@ -5,10 +5,14 @@ import logging
 
 DOMAIN: Final = "synology_hyper_backup"
 PLATFORMS: Final = ["sensor"]
+# Domain of the Synology DSM integration whose config entries this one uses
+SYNOLOGY_DSM_DOMAIN: Final = "synology_dsm"
 
 # Configuration
 CONF_COORDINATOR = "coordinator"
+CONF_STATUS_COORDINATOR = "status_coordinator"
 CONF_API = "api"
+DATA_FLEET = f"{DOMAIN}_fleet"
 
 LOGGER = logging.getLogger("custom_components." + DOMAIN)
 
@@ -20,11 +24,80 @@ CONFIG_DEVICE_MANUFACTURER = "device_manufacturer"
 CONFIG_DEVICE_MODEL = "device_model"
 CONFIG_DEVICE_SW_VERSION = "device_sw_version"
 
+# Options Flow Keys
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_SCAN_INTERVAL_ACTIVE = "scan_interval_active"
+CONF_SCAN_INTERVAL_IDLE = "scan_interval_idle"
+CONF_INCLUDE_KEYS = "include_keys"
+CONF_EXCLUDE_KEYS = "exclude_keys"
+CONF_COMPOUND_REQUESTS = "compound_requests"
+CONF_WATCH_LOG = "watch_log"
+CONF_IMPORT_HISTORY = "import_history"
+
 # Config Flow Step and Reason Constants
 STEP_USER = "user"
+STEP_INIT = "init"
 REASON_NO_DSM_INSTANCES = "no_dsm_instances"
 REASON_UNKNOWN = "unknown"
 REASON_INVALID_DSM_ENTRY = "invalid_dsm_entry"
 
 # Default values
-DEFAULT_SCAN_INTERVAL = 60  # seconds
+DEFAULT_SCAN_INTERVAL_ACTIVE = 10  # seconds, while any task is running
+DEFAULT_SCAN_INTERVAL_IDLE = 300  # seconds, while all tasks are idle
+MIN_SCAN_INTERVAL = 5  # seconds
+DEFAULT_MAX_CONCURRENT_REQUESTS = 4
+MAX_CONCURRENT_REQUESTS_LIMIT = 16
+# Shared by the entries of all NASes
+FLEET_MAX_CONCURRENT_REQUESTS = 16
+FLEET_STAGGER_INTERVAL = 5  # seconds between the first polls of entries
+DEFAULT_COMPOUND_REQUESTS = True
+DEFAULT_WATCH_LOG = True
+DEFAULT_IMPORT_HISTORY = True
+COMPOUND_REQUEST_SIZE = 50  # API calls packed into one SYNO.Entry.Request
+TASK_RETRY_BACKOFF_BASE = 30  # seconds, after the first failure of a task
+TASK_RETRY_BACKOFF_MAX = 1800  # seconds
+
+# Progress samples per running task used for transfer rates and ETA
+PROGRESS_SAMPLES = 12
+
+# Items of a list or dict task value exposed as sensor attributes
+MAX_ATTRIBUTE_ITEMS = 25
+
+# Upper bounds in seconds of the request latency histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Persisted snapshot of the last coordinator data
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 30  # seconds
+
+# Hyper Backup log
+LOG_PAGE_SIZE = 1000
+# Rows first fetched once earlier rows were seen; the page size doubles up to
+# LOG_PAGE_SIZE while every row is new.
+LOG_FIRST_PAGE_SIZE = 20
+LOG_TAIL_SIZE = 20  # rows fetched by each check of the log tail
+LOG_TAIL_INTERVAL = 15  # seconds between checks of the log tail
+BACKUP_RUN_LOG_KEYWORD = "Backup task"  # log rows of backup runs starting or ending
+INTEGRITY_CHECK_FINISHED_EVENT = (
+    "Backup integrity check is finished. No error was found."
+)
+
+# Task "status" values reported while a backup or integrity check is running
+ACTIVE_TASK_STATUSES: Final = frozenset(
+    {
+        "backingup",
+        "backup",
+        "preparing",
+        "starting",
+        "detect",
+        "detecting",
+        "error_detect",
+        "restore",
+        "restoring",
+        "resuming",
+        "canceling",
+        "suspending",
+        "version_deleting",
+        "relinking",
+    }
+)
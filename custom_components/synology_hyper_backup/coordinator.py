@@ -1,78 +1,753 @@
 """Data update coordinator for Synology Tasks."""
 
+import asyncio
 import logging
-from datetime import timedelta
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta
+from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from synology_api.core_backup import Backup
 
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
-from .utils import search_logs
+from .api import (
+    ApiCall,
+    SynologyApiError,
+    SynologyHyperBackupApi,
+    backup_task_list_call,
+    backup_task_result_call,
+    backup_task_status_call,
+    hb_logs_get_call,
+)
+from .const import (
+    ACTIVE_TASK_STATUSES,
+    COMPOUND_REQUEST_SIZE,
+    CONF_COMPOUND_REQUESTS,
+    CONF_EXCLUDE_KEYS,
+    CONF_INCLUDE_KEYS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_SCAN_INTERVAL_ACTIVE,
+    CONF_SCAN_INTERVAL_IDLE,
+    DEFAULT_COMPOUND_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_SCAN_INTERVAL_ACTIVE,
+    DEFAULT_SCAN_INTERVAL_IDLE,
+    DOMAIN,
+    INTEGRITY_CHECK_FINISHED_EVENT,
+    LATENCY_BUCKETS,
+    LOG_FIRST_PAGE_SIZE,
+    LOG_PAGE_SIZE,
+    LOG_TAIL_SIZE,
+    PROGRESS_SAMPLES,
+    TASK_RETRY_BACKOFF_BASE,
+    TASK_RETRY_BACKOFF_MAX,
+)
+from .key_overrides import DEFAULT_INCLUDE_KEYS, KEY_OVERRIDES
+from .scheduler import FleetScheduler
+from .utils import (
+    LOG_TASK_EVENT,
+    LOG_TASK_TAG,
+    KeyFilter,
+    LatencyStats,
+    LogCursor,
+    ProgressWindow,
+    TaskBackoff,
+    coerce_numeric,
+    diff_tasks,
+    index_logs,
+    parse_log_time,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class SynologyTasksCoordinator(DataUpdateCoordinator[list[dict]]):
-    """Class to manage fetching Synology task data."""
+class SynologyHyperBackupCoordinator(DataUpdateCoordinator[dict], ABC):
+    """Base class for the Hyper Backup coordinators of a config entry."""
 
-    def __init__(self, hass: HomeAssistant, synology_backup: Backup) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        api: SynologyHyperBackupApi,
+        semaphore: asyncio.Semaphore,
+        fleet: FleetScheduler,
+        name: str,
+        update_interval: timedelta,
+    ) -> None:
         """Initialize the data updater."""
         super().__init__(
             hass,
             _LOGGER,
-            name=DOMAIN,
-            update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
+            config_entry=config_entry,
+            name=name,
+            update_interval=update_interval,
         )
         self.hass = hass
-        self.synology_backup = synology_backup
+        self.api = api
+        # Shared by all coordinators of the entry to bound the number of DSM
+        # requests in flight.
+        self._semaphore = semaphore
+        # Shared by the entries of all NASes
+        self._fleet = fleet
+        self._compound_requests = config_entry.options.get(
+            CONF_COMPOUND_REQUESTS, DEFAULT_COMPOUND_REQUESTS
+        )
+        self.key_filter = KeyFilter(
+            config_entry.options.get(CONF_INCLUDE_KEYS, DEFAULT_INCLUDE_KEYS),
+            config_entry.options.get(CONF_EXCLUDE_KEYS, []),
+        )
+        # (prefix, payload key) -> (task key, whether it is a known numeric key),
+        # or None if the key is filtered out; payloads repeat the same keys
+        # every poll, so each is only looked at once.
+        self._fields: dict[tuple[str, str], tuple[str, bool] | None] = {}
+        # Keys changed per task id by the latest data, or None when every key
+        # must be treated as changed.
+        self.changed_keys: dict[Any, set[str]] | None = None
+        # Bumped whenever tasks or the keys of a task appear or disappear.
+        self.shape_version = 0
+        # Tasks whose latest fetch failed; they serve their last good values.
+        self.stale_task_ids: set = set()
+        self._backoff = TaskBackoff(TASK_RETRY_BACKOFF_BASE, TASK_RETRY_BACKOFF_MAX)
+        # Duration and outcome of the scheduled refreshes
+        self.refresh_stats = LatencyStats(LATENCY_BUCKETS)
 
-    @staticmethod
-    def _merge_with_prefix(task: dict, payload: dict | None, prefix: str) -> None:
-        """Merge payload data onto task under the given prefix."""
+    def _field(self, prefix: str, key: str) -> tuple[str, bool] | None:
+        """Return the task key of a payload key, see _fields."""
+        try:
+            return self._fields[(prefix, key)]
+        except KeyError:
+            pass
+        prefixed_key = f"{prefix}{key}"
+        field = None
+        if self.key_filter(prefixed_key):
+            override = KEY_OVERRIDES.get(prefixed_key)
+            field = (prefixed_key, bool(override and override.numeric))
+        self._fields[(prefix, key)] = field
+        return field
+
+    def _merge_with_prefix(self, task: dict, payload: dict | None, prefix: str) -> None:
+        """
+        Merge the allowed payload keys onto task under the given prefix.
+        Known numeric keys are coerced here once, so sensors do not parse
+        them on every read.
+        """
         if not isinstance(payload, dict):
             return
         data = payload.get("data", payload)
-        if isinstance(data, dict):
-            task.update({f"{prefix}{key}": value for key, value in data.items()})
+        if not isinstance(data, dict):
+            return
+        for key, value in data.items():
+            if (field := self._field(prefix, key)) is None:
+                continue
+            task_key, numeric = field
+            if numeric and (number := coerce_numeric(value)) is not None:
+                value = number
+            task[task_key] = value
+
+    def _publish(self, data: dict) -> dict:
+        """Index new data by task_id and record which keys changed."""
+        tasks_by_id = data["tasks_by_id"] = {
+            task.get("task_id"): task for task in data.get("task_list", [])
+        }
+        old_tasks_by_id = self.data.get("tasks_by_id") if self.data else None
+        if old_tasks_by_id is None:
+            self.changed_keys = None
+            self.shape_version += 1
+            return data
+
+        self.changed_keys = diff_tasks(old_tasks_by_id, tasks_by_id)
+        if old_tasks_by_id.keys() != tasks_by_id.keys() or any(
+            old_tasks_by_id[task_id].keys() != tasks_by_id[task_id].keys()
+            for task_id in self.changed_keys
+        ):
+            self.shape_version += 1
+        return data
+
+    async def _async_update_data(self) -> dict:
+        """Fetch data from API, recording how long the refresh took."""
+        start = time.monotonic()
+        try:
+            data = await self._async_fetch_data()
+        except Exception:
+            self.refresh_stats.record(time.monotonic() - start, failed=True)
+            raise
+        self.refresh_stats.record(time.monotonic() - start)
+        return data
+
+    @abstractmethod
+    async def _async_fetch_data(self) -> dict:
+        """Fetch the data of the coordinator."""
+
+    @callback
+    def async_restore(self, data: dict) -> None:
+        """Serve a persisted snapshot until the first refresh completes."""
+        self.data = self._publish(data)
+
+    @callback
+    def _async_set_partial_data(self, data: dict) -> None:
+        """
+        Publish data refreshed outside a full refresh. Unlike
+        async_set_updated_data, this leaves the next full refresh scheduled
+        where it was, so frequent partial refreshes cannot postpone it.
+        """
+        self.data = self._publish(data)
+        self.async_update_listeners()
+
+    def is_key_changed(self, task_id: Any, key: str) -> bool:
+        """Return True if the latest data changed the key of the task."""
+        return self.changed_keys is None or key in self.changed_keys.get(task_id, ())
+
+    def _last_task(self, task_id: Any) -> dict:
+        """Return the task as last published, or an empty dict."""
+        if not self.data:
+            return {}
+        return self.data.get("tasks_by_id", {}).get(task_id, {})
+
+    async def _async_call(
+        self, func: Callable[..., Awaitable[Any]], *args: Any
+    ) -> Any:
+        """Call the API, honouring the entry and fleet request limits."""
+        async with self._semaphore, self._fleet.async_slot(
+            self.config_entry.entry_id
+        ):
+            return await func(*args)
+
+    async def _async_call_many(
+        self, calls: list[ApiCall]
+    ) -> list[dict | BaseException]:
+        """
+        Run API calls and return their payloads in order.
+        Calls are packed into SYNO.Entry.Request compound requests when
+        enabled and supported, so a poll costs a few HTTP round trips
+        instead of one per call. A failed call yields its exception in
+        place of a payload instead of failing the other calls.
+        """
+        if not calls:
+            return []
+        await self.api.async_login()
+        if len(calls) < 2 or not (
+            self._compound_requests and self.api.supports_compound
+        ):
+            return await asyncio.gather(
+                *(self._async_call(self.api.async_request, call) for call in calls),
+                return_exceptions=True,
+            )
+
+        chunks = [
+            calls[start : start + COMPOUND_REQUEST_SIZE]
+            for start in range(0, len(calls), COMPOUND_REQUEST_SIZE)
+        ]
+        results = await asyncio.gather(
+            *(
+                self._async_call(self.api.async_request_compound, chunk)
+                for chunk in chunks
+            ),
+            return_exceptions=True,
+        )
+        payloads: list[dict | BaseException] = []
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, BaseException):
+                payloads.extend([result] * len(chunk))
+                continue
+            payloads.extend(
+                payload
+                if payload.get("success")
+                else SynologyApiError(call.api, payload.get("error", {}).get("code"))
+                for call, payload in zip(chunk, result)
+            )
+        return payloads
+
+    async def _async_fetch_tasks(
+        self, task_ids: list, build_call: Callable[[Any], ApiCall]
+    ) -> dict[Any, dict]:
+        """
+        Make one call per task and return the payloads of the tasks that
+        succeeded. Failed tasks are marked stale and retried with exponential
+        backoff; tasks still backing off are not called. Raises only if every
+        called task failed.
+        """
+        now = time.monotonic()
+        self._backoff.retain(task_ids)
+        due_ids = [
+            task_id for task_id in task_ids if self._backoff.is_due(task_id, now)
+        ]
+        results = await self._async_call_many(
+            [build_call(task_id) for task_id in due_ids]
+        )
+
+        payloads: dict[Any, dict] = {}
+        errors: list[BaseException] = []
+        for task_id, result in zip(due_ids, results):
+            if not isinstance(result, BaseException):
+                self._backoff.succeeded(task_id)
+                payloads[task_id] = result
+                continue
+            errors.append(result)
+            delay = self._backoff.failed(task_id, now)
+            _LOGGER.log(
+                logging.DEBUG if task_id in self.stale_task_ids else logging.WARNING,
+                "Updating Hyper Backup task %s failed, retrying in %d seconds: %s",
+                task_id,
+                delay,
+                result,
+            )
+        if errors and not payloads:
+            raise errors[0]
+
+        self.stale_task_ids = set(task_ids) - payloads.keys()
+        return payloads
+
+    @staticmethod
+    def _first_logs_call(cursor: LogCursor, filter_keyword: str = "") -> ApiCall:
+        """
+        Return the call fetching the first page of log rows for a cursor.
+        Until the cursor has seen a row, the whole page is fetched; after
+        that a few rows, as most polls find no or only a few new rows.
+        """
+        page_size = LOG_PAGE_SIZE if cursor.time is None else LOG_FIRST_PAGE_SIZE
+        return hb_logs_get_call(page_size, 0, filter_keyword)
+
+    async def _async_fetch_new_logs(
+        self,
+        cursor: LogCursor,
+        first_call: ApiCall,
+        hb_logs_resp: dict | BaseException,
+    ) -> list[dict]:
+        """
+        Page through the Hyper Backup log until reaching already seen rows.
+        hb_logs_resp is the already fetched response of first_call; each
+        further page is twice as large, up to LOG_PAGE_SIZE rows.
+        """
+        if isinstance(hb_logs_resp, BaseException):
+            raise hb_logs_resp
+        page_size = first_call.params["limit"]
+        filter_keyword = first_call.params["filter_keyword"]
+        new_logs: list[dict] = []
+        offset = 0
+        while True:
+            log_list = hb_logs_resp.get("data", {}).get("log_list", [])
+            reached_cursor = False
+            for entry in log_list:
+                if (when := parse_log_time(entry)) is None:
+                    continue
+                if cursor.is_older(when):
+                    reached_cursor = True
+                    break
+                if not cursor.is_seen(entry, when):
+                    new_logs.append(entry)
+            if reached_cursor or len(log_list) < page_size:
+                return new_logs
+            offset += page_size
+            page_size = min(page_size * 2, LOG_PAGE_SIZE)
+            hb_logs_resp = await self._async_call(
+                self.api.async_request,
+                hb_logs_get_call(page_size, offset, filter_keyword),
+            )
+
+    async def async_request(self, call: ApiCall) -> dict:
+        """Make one API call, honouring the entry and fleet request limits."""
+        return await self._async_call(self.api.async_request, call)
+
+    async def async_fetch_logs(
+        self, cursor: LogCursor, filter_keyword: str = ""
+    ) -> list[dict]:
+        """Return the Hyper Backup log rows not yet seen by a cursor, newest first."""
+        first_call = self._first_logs_call(cursor, filter_keyword)
+        (hb_logs_resp,) = await self._async_call_many([first_call])
+        return await self._async_fetch_new_logs(cursor, first_call, hb_logs_resp)
+
+
+class SynologyTasksCoordinator(SynologyHyperBackupCoordinator):
+    """Slow tier: task list, last results and integrity check logs."""
 
-    async def _async_update_data(self) -> list[dict]:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        api: SynologyHyperBackupApi,
+        fleet: FleetScheduler,
+    ) -> None:
+        """Initialize the data updater."""
+        super().__init__(
+            hass,
+            config_entry,
+            api,
+            asyncio.Semaphore(
+                config_entry.options.get(
+                    CONF_MAX_CONCURRENT_REQUESTS, DEFAULT_MAX_CONCURRENT_REQUESTS
+                )
+            ),
+            fleet,
+            name=DOMAIN,
+            update_interval=timedelta(
+                seconds=config_entry.options.get(
+                    CONF_SCAN_INTERVAL_IDLE, DEFAULT_SCAN_INTERVAL_IDLE
+                )
+            ),
+        )
+        # Integrity check log rows already processed, and the latest integrity
+        # check found per task name, so each poll only fetches new log rows.
+        self._integrity_log_cursor = LogCursor()
+        self._integrity_checks: dict[str, dict] = {}
+
+    def _is_key_kept(self, key: str) -> bool:
+        """Return True if a task list key is kept in the coordinator data."""
+        return key in ("task_id", "name") or self.key_filter(key)
+
+    def _integrity_logs_calls(self) -> list[ApiCall]:
+        """Return the call fetching the first page of integrity check logs."""
+        # Integrity check logs are skipped when their keys are filtered out.
+        if not self.key_filter.allows_prefix("integrity_check_"):
+            return []
+        return [
+            self._first_logs_call(
+                self._integrity_log_cursor, INTEGRITY_CHECK_FINISHED_EVENT
+            )
+        ]
+
+    async def _async_update_integrity_checks(
+        self, first_call: ApiCall, hb_logs_resp: dict | BaseException
+    ) -> None:
+        """Cache the integrity checks logged since the last update."""
+        try:
+            new_logs = await self._async_fetch_new_logs(
+                self._integrity_log_cursor, first_call, hb_logs_resp
+            )
+        except Exception as err:
+            # Keep the cached integrity checks; the cursor did not move, so
+            # the missed rows are fetched next time.
+            _LOGGER.debug("Fetching integrity check logs failed: %s", err)
+            return
+        # New rows are newer than anything cached, so they always win.
+        self._integrity_checks.update(index_logs(new_logs))
+        self._integrity_log_cursor.advance(new_logs)
+
+    def _update_task(self, task: dict, last_result: dict | None) -> None:
+        """Merge the last result and latest integrity check onto a task."""
+        for key in [key for key in task if not self._is_key_kept(key)]:
+            del task[key]
+
+        if (task_id := task.get("task_id")) in self.stale_task_ids:
+            # Serve the last good result until the task can be fetched again.
+            task.update(
+                {
+                    key: value
+                    for key, value in self._last_task(task_id).items()
+                    if key.startswith("last_result_")
+                }
+            )
+        else:
+            self._merge_with_prefix(task, last_result, "last_result_")
+
+        if latest_ic := self._integrity_checks.get(task.get("name")):
+            self._merge_with_prefix(task, latest_ic, "integrity_check_")
+
+    async def _async_fetch_data(self) -> dict:
         """Fetch data from API."""
         try:
-            tasks_list = await self.hass.async_add_executor_job(
-                self.synology_backup.backup_task_list
+            hb_logs_calls = self._integrity_logs_calls()
+            tasks_list, *hb_logs_resp = await self._async_call_many(
+                [backup_task_list_call(), *hb_logs_calls]
             )
+            if isinstance(tasks_list, BaseException):
+                raise tasks_list
             data = tasks_list.get("data", None)
             if data is None:
                 raise Exception("Unexpected data returned from Synology.")
 
-            hb_logs_resp = await self.hass.async_add_executor_job(
-                self.synology_backup.hb_logs_get,
-                1000,
-                0,
-                "Backup integrity check is finished. No error was found.",
+            if hb_logs_calls:
+                await self._async_update_integrity_checks(
+                    hb_logs_calls[0], hb_logs_resp[0]
+                )
+
+            task_list = data.get("task_list")
+            last_results: dict[Any, dict] = {}
+            if self.key_filter.allows_prefix("last_result_"):
+                last_results = await self._async_fetch_tasks(
+                    [task.get("task_id") for task in task_list],
+                    backup_task_result_call,
+                )
+            else:
+                self.stale_task_ids = set()
+            for task in task_list:
+                self._update_task(task, last_results.get(task.get("task_id")))
+
+            return self._publish(data)
+        except Exception as err:
+            msg = f"Error communicating with API: {err}"
+            raise UpdateFailed(msg) from err
+
+    async def async_refresh_task(self, task_id: Any) -> None:
+        """Refresh the last result and integrity check of one known task."""
+        if not self._last_task(task_id):
+            return
+        result_calls = (
+            [backup_task_result_call(task_id)]
+            if self.key_filter.allows_prefix("last_result_")
+            else []
+        )
+        hb_logs_calls = self._integrity_logs_calls()
+        results = await self._async_call_many([*hb_logs_calls, *result_calls])
+        if hb_logs_calls:
+            await self._async_update_integrity_checks(
+                hb_logs_calls[0], results.pop(0)
+            )
+        last_result = results[0] if results else None
+        if isinstance(last_result, BaseException):
+            _LOGGER.debug(
+                "Refreshing Hyper Backup task %s failed: %s", task_id, last_result
             )
+            return
 
-            log_list = hb_logs_resp.get("data", {}).get("log_list", [])
+        # Rebuild from the latest data; a full refresh may have finished
+        # while this one was waiting on DSM.
+        if not (old_task := self._last_task(task_id)):
+            return
+        task = {
+            key: value
+            for key, value in old_task.items()
+            if not key.startswith("last_result_") or last_result is None
+        }
+        if last_result is not None:
+            self.stale_task_ids.discard(task_id)
+            self._backoff.succeeded(task_id)
+        self._update_task(task, last_result)
+        self._async_set_partial_data(
+            {
+                **self.data,
+                "task_list": [
+                    task if other.get("task_id") == task_id else other
+                    for other in self.data.get("task_list", [])
+                ],
+            }
+        )
 
-            for task in data.get("task_list"):
-                latest_ic = search_logs(log_list, task.get("name"))
-                last_result = await self.hass.async_add_executor_job(
-                    self.synology_backup.backup_task_result, task.get("task_id")
-                )
-                status = await self.hass.async_add_executor_job(
-                    self.synology_backup.backup_task_status, task.get("task_id")
-                )
-                status = status.get("data", {})
-                status_progress = status.get("progress")
-                self._merge_with_prefix(task, last_result, "last_result_")
-                self._merge_with_prefix(task, status, "status_")
-                self._merge_with_prefix(task, status_progress, "status_progress_")
 
-                if log_list and latest_ic:
-                    self._merge_with_prefix(task, latest_ic, "integrity_check_")
+class SynologyTaskStatusCoordinator(SynologyHyperBackupCoordinator):
+    """Fast tier: status and progress of the tasks known to the slow tier."""
 
-            return data
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        tasks_coordinator: SynologyTasksCoordinator,
+    ) -> None:
+        """Initialize the data updater."""
+        self._active_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_SCAN_INTERVAL_ACTIVE, DEFAULT_SCAN_INTERVAL_ACTIVE
+            )
+        )
+        self._idle_interval = timedelta(
+            seconds=config_entry.options.get(
+                CONF_SCAN_INTERVAL_IDLE, DEFAULT_SCAN_INTERVAL_IDLE
+            )
+        )
+        super().__init__(
+            hass,
+            config_entry,
+            tasks_coordinator.api,
+            tasks_coordinator._semaphore,
+            tasks_coordinator._fleet,
+            name=f"{DOMAIN}_status",
+            update_interval=self._idle_interval,
+        )
+        self.tasks_coordinator = tasks_coordinator
+        self._active_task_ids: set = set()
+        # Recent progress samples of the running tasks
+        self._progress: dict[Any, ProgressWindow] = {}
+        # Hyper Backup log rows already seen by async_check_log_tail, and
+        # whether the first check placed the cursor at the end of the log
+        self._log_tail_cursor = LogCursor()
+        self._log_tail_initialized = False
+        self._log_tail_lock = asyncio.Lock()
+
+    def _task_ids(self) -> list:
+        """Return the ids of the tasks known to the slow tier."""
+        if not self.tasks_coordinator.data:
+            return []
+        return [
+            task.get("task_id")
+            for task in self.tasks_coordinator.data.get("task_list", [])
+        ]
+
+    @callback
+    def async_handle_tasks_update(self) -> None:
+        """Fetch the status of tasks the slow tier just discovered."""
+        if self.data is None or not self.key_filter.allows_prefix("status_"):
+            return
+        known_ids = {task.get("task_id") for task in self.data.get("task_list", [])}
+        if not known_ids.issuperset(self._task_ids()):
+            self.hass.async_create_task(self.async_request_refresh())
+
+    def _update_task(self, task_id, status: dict | None) -> tuple[dict, bool]:
+        """Build the status keys of a task and whether the task is running."""
+        if status is None:
+            # Serve the last good status until the task can be fetched again.
+            return (
+                self._last_task(task_id) or {"task_id": task_id},
+                task_id in self._active_task_ids,
+            )
+        task = {"task_id": task_id}
+        status = status.get("data", {})
+        status_progress = status.get("progress")
+        self._merge_with_prefix(task, status, "status_")
+        self._merge_with_prefix(task, status_progress, "status_progress_")
+        active = status.get("status") in ACTIVE_TASK_STATUSES
+        if active and isinstance(status_progress, dict):
+            derived = self._sample_progress(task_id, status_progress)
+            self._merge_with_prefix(task, derived, "status_progress_")
+        return task, active
+
+    def _sample_progress(self, task_id: Any, progress: dict) -> dict:
+        """Add a progress sample of a running task and return its rates and ETA."""
+        processed = coerce_numeric(progress.get("processed_size"))
+        transmitted = coerce_numeric(progress.get("transmitted_size"))
+        if processed is None or transmitted is None:
+            return {}
+        # A task that was not running at the last poll started a new run.
+        if task_id not in self._active_task_ids or task_id not in self._progress:
+            self._progress[task_id] = ProgressWindow(PROGRESS_SAMPLES)
+        window = self._progress[task_id]
+        window.add(time.monotonic(), processed, transmitted)
+
+        total = coerce_numeric(progress.get("total_size"))
+        derived = {
+            "transfer_rate": window.transfer_rate(),
+            "transfer_rate_avg": window.average_transfer_rate(),
+            "eta": window.eta(total) if total is not None else None,
+        }
+        return {
+            key: None if value is None else round(value)
+            for key, value in derived.items()
+        }
+
+    async def _async_fetch_data(self) -> dict:
+        """Fetch data from API."""
+        # Nothing to fetch when every status key is filtered out.
+        task_ids = (
+            self._task_ids() if self.key_filter.allows_prefix("status_") else []
+        )
+        try:
+            statuses = await self._async_fetch_tasks(task_ids, backup_task_status_call)
         except Exception as err:
             msg = f"Error communicating with API: {err}"
             raise UpdateFailed(msg) from err
+
+        results = [
+            self._update_task(task_id, statuses.get(task_id)) for task_id in task_ids
+        ]
+        for task_id in self._set_active_task_ids(
+            {task["task_id"] for task, active in results if active}
+        ):
+            # A run just finished; pick up its result without waiting for the
+            # slow tier's next poll.
+            self.hass.async_create_task(
+                self.tasks_coordinator.async_refresh_task(task_id)
+            )
+        return self._publish({"task_list": [task for task, _ in results]})
+
+    def _set_active_task_ids(self, active_task_ids: set) -> set:
+        """
+        Track the running tasks and adapt the poll rate to them.
+        Returns the ids of the tasks that stopped running.
+        """
+        finished_task_ids = self._active_task_ids - active_task_ids
+        self._active_task_ids = active_task_ids
+        for task_id in self._progress.keys() - active_task_ids:
+            del self._progress[task_id]
+        # Requests of a NAS with a running task go first across the fleet.
+        self._fleet.set_busy(self.config_entry.entry_id, bool(active_task_ids))
+
+        # Poll fast while something is running so progress stays current,
+        # and back off while every task is idle.
+        self.update_interval = (
+            self._active_interval if active_task_ids else self._idle_interval
+        )
+        return finished_task_ids
+
+    async def async_refresh_task(self, task_id: Any) -> None:
+        """
+        Refresh the status of one known task. If the task is not running
+        afterwards, its last result is refreshed by the slow tier as well.
+        """
+        if self.data is None or not self.key_filter.allows_prefix("status_"):
+            await self.tasks_coordinator.async_refresh_task(task_id)
+            return
+        (status,) = await self._async_call_many([backup_task_status_call(task_id)])
+        if isinstance(status, BaseException):
+            _LOGGER.debug(
+                "Refreshing Hyper Backup task %s failed: %s", task_id, status
+            )
+            return
+
+        self.stale_task_ids.discard(task_id)
+        self._backoff.succeeded(task_id)
+        task, active = self._update_task(task_id, status)
+        self._set_active_task_ids(
+            self._active_task_ids | {task_id}
+            if active
+            else self._active_task_ids - {task_id}
+        )
+        task_list = [
+            task if other.get("task_id") == task_id else other
+            for other in self.data.get("task_list", [])
+        ]
+        if task_id not in self.data.get("tasks_by_id", {}):
+            task_list.append(task)
+        self._async_set_partial_data({"task_list": task_list})
+        if not active:
+            await self.tasks_coordinator.async_refresh_task(task_id)
+
+    async def async_check_log_tail(self, _now: datetime | None = None) -> None:
+        """
+        Fetch the newest Hyper Backup log rows and refresh the tasks they
+        report as started or finished, so completion is noticed within
+        seconds without polling every task faster.
+        """
+        # Skip the check while a slow NAS is still answering the last one.
+        if not self.tasks_coordinator.data or self._log_tail_lock.locked():
+            return
+        async with self._log_tail_lock:
+            await self._async_check_log_tail()
+
+    async def _async_check_log_tail(self) -> None:
+        """Check the log tail; see async_check_log_tail."""
+        try:
+            first_call = hb_logs_get_call(LOG_TAIL_SIZE)
+            (hb_logs_resp,) = await self._async_call_many([first_call])
+            if not self._log_tail_initialized:
+                # Only remember where the log ends on the first check; an
+                # empty log leaves the cursor unset, so every row logged
+                # from then on is new.
+                if isinstance(hb_logs_resp, BaseException):
+                    raise hb_logs_resp
+                self._log_tail_cursor.advance(
+                    hb_logs_resp.get("data", {}).get("log_list", [])
+                )
+                self._log_tail_initialized = True
+                return
+            new_logs = await self._async_fetch_new_logs(
+                self._log_tail_cursor, first_call, hb_logs_resp
+            )
+        except Exception as err:
+            _LOGGER.debug("Checking the Hyper Backup log failed: %s", err)
+            return
+        self._log_tail_cursor.advance(new_logs)
+
+        task_ids = {
+            task.get("name"): task.get("task_id")
+            for task in self.tasks_coordinator.data.get("task_list", [])
+        }
+        refresh_ids = {
+            task_ids[match["task"]]
+            for entry in new_logs
+            if LOG_TASK_EVENT.search(event := entry.get("event", ""))
+            and (match := LOG_TASK_TAG.match(event))
+            and match["task"] in task_ids
+        }
+        await asyncio.gather(
+            *(self.async_refresh_task(task_id) for task_id in refresh_ids)
+        )
@@ -0,0 +1,58 @@
+"""Diagnostics support for Synology Hyper Backup."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .const import (
+    CONF_API,
+    CONF_COORDINATOR,
+    CONF_STATUS_COORDINATOR,
+    CONFIG_DEVICE_IDENTIFIERS,
+    DOMAIN,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SynologyHyperBackupCoordinator
+
+# The device identifiers contain the serial number of the NAS.
+TO_REDACT = {CONFIG_DEVICE_IDENTIFIERS, "password", "username", "sid", "synotoken"}
+
+
+def _coordinator_diagnostics(coordinator: SynologyHyperBackupCoordinator) -> dict:
+    """Return the refresh stats and latest data of a coordinator."""
+    return {
+        "update_interval": coordinator.update_interval.total_seconds(),
+        "last_update_success": coordinator.last_update_success,
+        "refresh": coordinator.refresh_stats.as_dict(),
+        "stale_task_ids": sorted(coordinator.stale_task_ids, key=str),
+        "task_list": async_redact_data(
+            (coordinator.data or {}).get("task_list", []), TO_REDACT
+        ),
+    }
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "api": {
+            endpoint: stats.as_dict()
+            for endpoint, stats in entry_data[CONF_API].stats.items()
+        },
+        "tasks_coordinator": _coordinator_diagnostics(entry_data[CONF_COORDINATOR]),
+        "status_coordinator": _coordinator_diagnostics(
+            entry_data[CONF_STATUS_COORDINATOR]
+        ),
+    }
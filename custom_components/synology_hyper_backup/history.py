@@ -0,0 +1,287 @@
+"""Import of past Hyper Backup runs into long-term statistics."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import async_add_external_statistics
+from homeassistant.const import UnitOfInformation, UnitOfTime
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import (
+    BACKUP_RUN_LOG_KEYWORD,
+    CONFIG_DEVICE_NAME,
+    DOMAIN,
+    LOGGER,
+    STORAGE_VERSION,
+)
+from .utils import LOG_TASK_TAG, LOG_TIME_FORMAT, LogCursor, parse_log_time
+
+try:
+    from homeassistant.components.recorder.models import StatisticMeanType
+except ImportError:  # Home Assistant before 2025.4
+    StatisticMeanType = None
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import SynologyTasksCoordinator
+
+# Log events of a backup run starting or ending, like
+# "[Network][<task>] Backup task finished successfully."
+LOG_BACKUP_RUN = re.compile(
+    r"\bbackup task (?:was |has been )?"
+    r"(?P<outcome>start|partially complet|finish|complet|fail|cancel|abort|suspend)",
+    re.IGNORECASE,
+)
+SUCCESSFUL_OUTCOMES = frozenset({"finish", "complet"})
+# A data size logged with the end of a run, in binary units
+LOG_DATA_SIZE = re.compile(
+    r"(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>[KMGTP]?B)\b", re.IGNORECASE
+)
+DATA_SIZE_UNITS = {"B": 0, "KB": 1, "MB": 2, "GB": 3, "TB": 4, "PB": 5}
+
+
+def history_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the import watermark of the entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}.history")
+
+
+def _hour_start(when: datetime) -> datetime:
+    """Return the start of the hour of a time."""
+    return when.replace(minute=0, second=0, microsecond=0)
+
+
+def _log_time_to_utc(when: datetime) -> datetime:
+    """Convert a naive log time, in the local time of the NAS, to UTC."""
+    return dt_util.as_utc(when.replace(tzinfo=dt_util.get_default_time_zone()))
+
+
+def _data_size(message: str) -> float | None:
+    """Return the bytes of the first data size mentioned in a log message."""
+    if not (match := LOG_DATA_SIZE.search(message)):
+        return None
+    return float(match["value"]) * 1024 ** DATA_SIZE_UNITS[match["unit"].upper()]
+
+
+@dataclass
+class _HourRuns:
+    """Backup runs of a task that ended within the same hour."""
+
+    durations: list[float] = field(default_factory=list)
+    transferred: float | None = None
+    succeeded: int = 0
+    failed: int = 0
+
+
+class BackupHistoryImporter:
+    """
+    Import the duration, transferred bytes and outcome of the backup runs
+    logged by Hyper Backup as external long-term statistics.
+    Runs are imported per finished hour; the persisted watermark is the end
+    of the last imported hour, so each import only walks the log rows
+    logged since then.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: ConfigEntry,
+        coordinator: SynologyTasksCoordinator,
+    ) -> None:
+        """Initialize the importer; the watermark is loaded by async_load."""
+        self._hass = hass
+        self._coordinator = coordinator
+        self._device_name = entry.data.get(CONFIG_DEVICE_NAME) or entry.title
+        self._store = history_store(hass, entry)
+        self._imported_until: datetime | None = None
+        # Task name -> log time of a run started before the watermark
+        self._open_runs: dict[str, str] = {}
+        # Statistic id -> running total of a sum statistic
+        self._sums: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def async_load(self) -> None:
+        """Load the watermark and running totals of previous imports."""
+        if not (data := await self._store.async_load()):
+            return
+        if imported_until := data.get("imported_until"):
+            self._imported_until = dt_util.parse_datetime(imported_until)
+        self._open_runs = data.get("open_runs", {})
+        self._sums = data.get("sums", {})
+
+    def is_due(self) -> bool:
+        """Return True if an hour finished since the last import."""
+        return not self._lock.locked() and (
+            self._imported_until is None
+            or self._imported_until < _hour_start(dt_util.utcnow())
+        )
+
+    async def async_import(self) -> None:
+        """Import the runs that ended between the watermark and this hour."""
+        async with self._lock:
+            until = _hour_start(dt_util.utcnow())
+            cursor = LogCursor()
+            if self._imported_until is not None:
+                cursor.time = dt_util.as_local(self._imported_until).replace(
+                    tzinfo=None
+                )
+            try:
+                new_logs = await self._coordinator.async_fetch_logs(
+                    cursor, BACKUP_RUN_LOG_KEYWORD
+                )
+            except Exception as err:
+                # The watermark did not move, so the rows are fetched next time.
+                LOGGER.debug("Fetching the Hyper Backup run history failed: %s", err)
+                return
+
+            self._add_statistics(self._collect_runs(new_logs, until))
+            self._imported_until = until
+            await self._store.async_save(
+                {
+                    "imported_until": until.isoformat(),
+                    "open_runs": self._open_runs,
+                    "sums": self._sums,
+                }
+            )
+
+    def _collect_runs(
+        self, log_list: list[dict], until: datetime
+    ) -> dict[str, dict[datetime, _HourRuns]]:
+        """
+        Pair the start and end rows of backup runs ending before until and
+        group the runs per task and hour. Rows of the current hour are left
+        for the next import, which fetches them again.
+        """
+        runs: dict[str, dict[datetime, _HourRuns]] = {}
+        # The log is newest first; pair the rows in the order they happened.
+        for entry in reversed(log_list):
+            event = entry.get("event", "")
+            if (when := parse_log_time(entry)) is None or not (
+                tag := LOG_TASK_TAG.match(event)
+            ):
+                continue
+            # Only the message after the tag; task names may hold sizes too.
+            message = event[tag.end() :]
+            if not (run := LOG_BACKUP_RUN.search(message)):
+                continue
+            if (ended := _log_time_to_utc(when)) >= until:
+                continue
+            task_name = tag["task"]
+            if (outcome := run["outcome"].lower()) == "start":
+                self._open_runs[task_name] = entry["time"]
+                continue
+
+            hour_runs = runs.setdefault(task_name, {}).setdefault(
+                _hour_start(ended), _HourRuns()
+            )
+            if outcome in SUCCESSFUL_OUTCOMES:
+                hour_runs.succeeded += 1
+            else:
+                hour_runs.failed += 1
+            if (started := self._open_runs.pop(task_name, None)) is not None:
+                duration = (
+                    when - datetime.strptime(started, LOG_TIME_FORMAT)
+                ).total_seconds()
+                if duration >= 0:
+                    hour_runs.durations.append(duration)
+            if (size := _data_size(message)) is not None:
+                hour_runs.transferred = (hour_runs.transferred or 0) + size
+        return runs
+
+    def _metadata(
+        self, statistic_id: str, name: str, unit: str | None, has_mean: bool
+    ) -> StatisticMetaData:
+        """Return the metadata of a statistic holding either a mean or a sum."""
+        metadata = StatisticMetaData(
+            has_mean=has_mean,
+            has_sum=not has_mean,
+            name=name,
+            source=DOMAIN,
+            statistic_id=statistic_id,
+            unit_of_measurement=unit,
+        )
+        if StatisticMeanType is not None:
+            metadata["mean_type"] = (
+                StatisticMeanType.ARITHMETIC if has_mean else StatisticMeanType.NONE
+            )
+        return metadata
+
+    def _add_sum(
+        self,
+        statistic_id: str,
+        name: str,
+        unit: str | None,
+        values: list[tuple[datetime, float]],
+    ) -> None:
+        """Add hourly values to a sum statistic, continuing its running total."""
+        if not values:
+            return
+        total = self._sums.get(statistic_id, 0)
+        statistics: list[StatisticData] = []
+        for hour, value in values:
+            total += value
+            statistics.append(StatisticData(start=hour, state=value, sum=total))
+        self._sums[statistic_id] = total
+        async_add_external_statistics(
+            self._hass, self._metadata(statistic_id, name, unit, False), statistics
+        )
+
+    def _add_statistics(self, runs: dict[str, dict[datetime, _HourRuns]]) -> None:
+        """Add the statistics of the collected runs to the recorder."""
+        for task_name, hours in runs.items():
+            name = f"{self._device_name} {task_name}"
+            statistic_prefix = f"{DOMAIN}:{slugify(name)}"
+            hours = dict(sorted(hours.items()))
+
+            if durations := [
+                StatisticData(
+                    start=hour,
+                    mean=sum(hour_runs.durations) / len(hour_runs.durations),
+                    min=min(hour_runs.durations),
+                    max=max(hour_runs.durations),
+                )
+                for hour, hour_runs in hours.items()
+                if hour_runs.durations
+            ]:
+                async_add_external_statistics(
+                    self._hass,
+                    self._metadata(
+                        f"{statistic_prefix}_backup_duration",
+                        f"{name} backup duration",
+                        UnitOfTime.SECONDS,
+                        True,
+                    ),
+                    durations,
+                )
+            self._add_sum(
+                f"{statistic_prefix}_backup_transferred",
+                f"{name} backup transferred",
+                UnitOfInformation.BYTES,
+                [
+                    (hour, hour_runs.transferred)
+                    for hour, hour_runs in hours.items()
+                    if hour_runs.transferred is not None
+                ],
+            )
+            self._add_sum(
+                f"{statistic_prefix}_backups_succeeded",
+                f"{name} backups succeeded",
+                None,
+                [(hour, hour_runs.succeeded) for hour, hour_runs in hours.items()],
+            )
+            self._add_sum(
+                f"{statistic_prefix}_backups_failed",
+                f"{name} backups failed",
+                None,
+                [(hour, hour_runs.failed) for hour, hour_runs in hours.items()],
+            )
+        if runs:
+            LOGGER.debug("Imported the backup runs of %d tasks", len(runs))
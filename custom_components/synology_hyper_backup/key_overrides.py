@@ -6,7 +6,12 @@ from dataclasses import dataclass
 from typing import Optional
 
 from homeassistant.components.sensor import SensorDeviceClass, SensorStateClass
-from homeassistant.const import PERCENTAGE, UnitOfInformation
+from homeassistant.const import (
+    PERCENTAGE,
+    UnitOfDataRate,
+    UnitOfInformation,
+    UnitOfTime,
+)
 
 
 @dataclass(frozen=True)
@@ -49,4 +54,40 @@ KEY_OVERRIDES: dict[str, KeyOverride] = {
         device_class=SensorDeviceClass.DATA_SIZE,
         numeric=True,
     ),
+    # Derived by the coordinator from recent progress samples
+    "status_progress_transfer_rate": KeyOverride(
+        name="Progress: Transfer Rate",
+        unit=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DATA_RATE,
+        numeric=True,
+    ),
+    "status_progress_transfer_rate_avg": KeyOverride(
+        name="Progress: Average Transfer Rate",
+        unit=UnitOfDataRate.BYTES_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DATA_RATE,
+        numeric=True,
+    ),
+    "status_progress_eta": KeyOverride(
+        name="Progress: Time Remaining",
+        unit=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        numeric=True,
+    ),
 }
+
+
+# Keys sensors are created for unless the allowlist is changed in the options:
+# every key with an override plus the keys commonly used in dashboards.
+DEFAULT_INCLUDE_KEYS: list[str] = [
+    *KEY_OVERRIDES,
+    "state",
+    "status",
+    "last_result_last_bkp_*",
+    "last_result_next_bkp_time",
+    "status_state",
+    "status_status",
+    "status_progress_*",
+    "integrity_check_time",
+]
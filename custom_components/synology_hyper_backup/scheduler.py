@@ -0,0 +1,85 @@
+"""Request scheduling shared by the config entries of all NASes."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+# Priorities of the requests waiting for a free slot; lower goes first.
+PRIORITY_BUSY = 0
+PRIORITY_IDLE = 1
+
+
+class FleetScheduler:
+    """
+    Global limit on the DSM requests in flight across all entries.
+    Waiting requests of entries with a running task are served first, and
+    every entry gets a stagger slot so their polls do not fire together.
+    """
+
+    def __init__(self, max_requests: int, stagger: float) -> None:
+        """Initialize with the request limit and the delay between slots."""
+        self._available = max_requests
+        self._stagger = stagger
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+        self._slots: dict[str, int] = {}
+        self._busy_entries: set[str] = set()
+
+    def register(self, entry_id: str) -> float:
+        """Give an entry the first free stagger slot and return its delay."""
+        taken = set(self._slots.values())
+        slot = next(slot for slot in itertools.count() if slot not in taken)
+        self._slots[entry_id] = slot
+        return slot * self._stagger
+
+    def unregister(self, entry_id: str) -> None:
+        """Free the stagger slot of an unloaded entry."""
+        self._slots.pop(entry_id, None)
+        self._busy_entries.discard(entry_id)
+
+    def set_busy(self, entry_id: str, busy: bool) -> None:
+        """Mark whether an entry has a running task."""
+        if busy:
+            self._busy_entries.add(entry_id)
+        else:
+            self._busy_entries.discard(entry_id)
+
+    @asynccontextmanager
+    async def async_slot(self, entry_id: str) -> AsyncIterator[None]:
+        """Hold one of the global request slots."""
+        await self._async_acquire(
+            PRIORITY_BUSY if entry_id in self._busy_entries else PRIORITY_IDLE
+        )
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int) -> None:
+        """Wait for a free slot, behind waiters of the same or higher priority."""
+        if self._available > 0 and not self._waiters:
+            self._available -= 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Pass on a slot that was handed over just before cancelling;
+            # otherwise the cancelled waiter is skipped by _release.
+            if waiter.done() and not waiter.cancelled():
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        """Hand the slot to the first waiter still waiting, or free it."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._available += 1
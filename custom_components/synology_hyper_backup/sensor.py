@@ -1,24 +1,49 @@
 """Support for Synology DSM Task sensors."""
 
 from __future__ import annotations
+import itertools
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from homeassistant.const import PERCENTAGE, STATE_UNKNOWN
-from homeassistant.components.sensor import SensorEntity
+from homeassistant.const import (
+    PERCENTAGE,
+    STATE_UNKNOWN,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    CONF_COORDINATOR,
+    CONF_EXCLUDE_KEYS,
+    CONF_INCLUDE_KEYS,
+    CONF_STATUS_COORDINATOR,
     CONFIG_DEVICE_IDENTIFIERS,
     CONFIG_DEVICE_MANUFACTURER,
     CONFIG_DEVICE_MODEL,
     CONFIG_DEVICE_NAME,
     CONFIG_DEVICE_SW_VERSION,
     DOMAIN,
+    MAX_ATTRIBUTE_ITEMS,
+)
+from .coordinator import (
+    SynologyHyperBackupCoordinator,
+    SynologyTaskStatusCoordinator,
+    SynologyTasksCoordinator,
 )
-from .coordinator import SynologyTasksCoordinator
 from .key_overrides import KEY_OVERRIDES, KeyOverride
+from .utils import coerce_numeric, is_numeric
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -28,7 +53,31 @@ if TYPE_CHECKING:
     from homeassistant.helpers.typing import StateType
 
 
-class SynologyTaskSensor(CoordinatorEntity[SynologyTasksCoordinator], SensorEntity):
+def _unique_id(name: str, key: str) -> str:
+    """Return the unique id of the sensor for a task key."""
+    task_name_id = name.lower().replace(" ", "_")
+    return f"{task_name_id}_{key}"
+
+
+def _device_info(config_entry: ConfigEntry) -> DeviceInfo | None:
+    """Return the Synology DSM device the sensors of an entry belong to."""
+    if not config_entry.data.get(CONFIG_DEVICE_IDENTIFIERS):
+        return None
+    identifiers = {
+        tuple(identifier) for identifier in config_entry.data[CONFIG_DEVICE_IDENTIFIERS]
+    }
+    return DeviceInfo(
+        identifiers=identifiers,
+        name=config_entry.data.get(CONFIG_DEVICE_NAME),
+        manufacturer=config_entry.data.get(CONFIG_DEVICE_MANUFACTURER),
+        model=config_entry.data.get(CONFIG_DEVICE_MODEL),
+        sw_version=config_entry.data.get(CONFIG_DEVICE_SW_VERSION),
+    )
+
+
+class SynologyTaskSensor(
+    CoordinatorEntity[SynologyHyperBackupCoordinator], SensorEntity
+):
     """Representation of a Synology task sensor."""
 
     def __init__(
@@ -36,14 +85,13 @@ class SynologyTaskSensor(CoordinatorEntity[SynologyTasksCoordinator], SensorEnti
         name: str,
         key: str,
         task: dict,
-        coordinator: SynologyTasksCoordinator,
+        coordinator: SynologyHyperBackupCoordinator,
         config_entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
 
-        task_name_id = name.lower().replace(" ", "_")
-        self._attr_unique_id = f"{task_name_id}_{key}"
+        self._attr_unique_id = _unique_id(name, key)
         self.unique_id = self._attr_unique_id
         self.task = task
         self.key = key
@@ -52,7 +100,7 @@ class SynologyTaskSensor(CoordinatorEntity[SynologyTasksCoordinator], SensorEnti
         self._numeric_expected = (
             override.numeric
             if override and override.numeric is not None
-            else self._is_numeric(task.get(key))
+            else is_numeric(task.get(key))
         )
         self._attr_name = (
             f"Hyper Backup: {name} - {override.name}"
@@ -68,29 +116,70 @@ class SynologyTaskSensor(CoordinatorEntity[SynologyTasksCoordinator], SensorEnti
                 self._attr_device_class = override.device_class
 
         # Set device info from the Synology DSM device
-        if config_entry.data.get(CONFIG_DEVICE_IDENTIFIERS):
-            identifiers = {
-                tuple(identifier)
-                for identifier in config_entry.data[CONFIG_DEVICE_IDENTIFIERS]
-            }
-            self._attr_device_info = DeviceInfo(
-                identifiers=identifiers,
-                name=config_entry.data.get(CONFIG_DEVICE_NAME),
-                manufacturer=config_entry.data.get(CONFIG_DEVICE_MANUFACTURER),
-                model=config_entry.data.get(CONFIG_DEVICE_MODEL),
-                sw_version=config_entry.data.get(CONFIG_DEVICE_SW_VERSION),
-            )
+        if device_info := _device_info(config_entry):
+            self._attr_device_info = device_info
 
         self._attr_has_entity_name = False
+        self._written_data: dict | None = None
+        self._written_available: bool | None = None
+        self._written_stale: bool | None = None
+        self._update_state()
 
-    @property
-    def native_value(self) -> StateType:
-        """Return the state of the sensor."""
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state and remember the data it is written from."""
+        await super().async_added_to_hass()
+        # The coordinator may have updated since the sensor was created.
+        self._update_state()
+        self._written_data = self.coordinator.data
+        self._written_available = self.available
+        self._written_stale = self._is_stale()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only if availability, staleness or the key changed."""
+        available = self.available
+        stale = self._is_stale()
+        if (
+            available == self._written_available
+            and stale == self._written_stale
+            and (
+                self.coordinator.data is self._written_data
+                or not self.coordinator.is_key_changed(
+                    self.task.get("task_id"), self.key
+                )
+            )
+        ):
+            return
+        self._written_data = self.coordinator.data
+        self._written_available = available
+        self._written_stale = stale
+        self._update_state()
+        super()._handle_coordinator_update()
+
+    def _is_stale(self) -> bool:
+        """Return True if the task's last update failed and its value is old."""
+        return self.task.get("task_id") in self.coordinator.stale_task_ids
+
+    def _update_state(self) -> None:
+        """
+        Compute the state and attributes from the latest coordinator data.
+        Called once per written update, so reads are served from _attr_*.
+        """
         if not (task := self._get_task()):
-            return None
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
         value = task.get(self.key)
-        if self._numeric_expected or self._is_numeric(value):
-            numeric_value = self._coerce_numeric(value)
+        self._attr_native_value = self._compute_native_value(value)
+        self._attr_extra_state_attributes = self._compute_attributes(value)
+
+    def _compute_native_value(self, value) -> StateType:
+        """Return the state of the sensor for a task value."""
+        # Known numeric keys are already coerced by the coordinator.
+        if type(value) in (int, float):
+            return value
+        if self._numeric_expected or is_numeric(value):
+            numeric_value = coerce_numeric(value)
             if numeric_value is not None:
                 return numeric_value
             if self._numeric_expected:
@@ -105,60 +194,191 @@ class SynologyTaskSensor(CoordinatorEntity[SynologyTasksCoordinator], SensorEnti
             return STATE_UNKNOWN
         return value
 
-    @property
-    def extra_state_attributes(self) -> dict[str, str | int | bool | datetime | None]:
-        """Return the state attributes."""
-        if not (task := self._get_task()):
-            return None
-        value = task.get(self.key)
+    def _compute_attributes(
+        self, value
+    ) -> dict[str, str | int | bool | datetime | None]:
+        """Return the state attributes for a task value."""
+        # Large payloads are capped; the recorder stores attributes with
+        # every state change.
         if isinstance(value, dict):
-            return value
-        if isinstance(value, list):
-            return {f"{self.key}_item_{idx}": item for idx, item in enumerate(value)}
-        return {}
+            attributes = dict(itertools.islice(value.items(), MAX_ATTRIBUTE_ITEMS))
+        elif isinstance(value, list):
+            attributes = {
+                f"{self.key}_item_{idx}": item
+                for idx, item in enumerate(value[:MAX_ATTRIBUTE_ITEMS])
+            }
+        else:
+            attributes = {}
+        if isinstance(value, (dict, list)) and len(value) > MAX_ATTRIBUTE_ITEMS:
+            attributes[f"{self.key}_item_count"] = len(value)
+        # Identifies the task to the services
+        attributes["task_id"] = self.task.get("task_id")
+        if self._is_stale():
+            attributes["stale"] = True
+        return attributes
 
     def _get_task(self):
         """Get the task data from the coordinator."""
         if not self.coordinator.data:
             return None
-        return next(
-            (
-                task
-                for task in self.coordinator.data.get("task_list")
-                if task.get("task_id") == self.task.get("task_id")
-            ),
-            None,
+        return self.coordinator.data.get("tasks_by_id", {}).get(
+            self.task.get("task_id")
         )
 
-    @staticmethod
-    def _is_numeric(value) -> bool:
-        """Check if a value is numeric or a numeric string."""
-        if isinstance(value, bool):
-            return False
-        if isinstance(value, (int, float)):
-            return True
-        if isinstance(value, str):
-            try:
-                float(value)
-                return True
-            except (TypeError, ValueError):
-                return False
-        return False
-
-    @staticmethod
-    def _coerce_numeric(value):
-        """Convert a value to int or float if possible."""
-        if isinstance(value, bool) or value is None:
-            return None
-        if isinstance(value, (int, float)):
-            return value
-        if isinstance(value, str):
-            try:
-                as_float = float(value)
-                return int(as_float) if as_float.is_integer() else as_float
-            except (TypeError, ValueError):
-                return None
+
+def _api_stats(
+    coordinator: SynologyHyperBackupCoordinator, field: str
+) -> dict[str, int]:
+    """Return a counter of the API client's stats per endpoint."""
+    return {
+        endpoint: getattr(stats, field)
+        for endpoint, stats in coordinator.api.stats.items()
+    }
+
+
+def _api_mean_latency(coordinator: SynologyHyperBackupCoordinator) -> float | None:
+    """Return the mean latency in milliseconds of all timed API requests."""
+    stats = coordinator.api.stats.values()
+    if not (timed := sum(sum(endpoint.histogram) for endpoint in stats)):
+        return None
+    return round(sum(endpoint.total_latency for endpoint in stats) / timed * 1000)
+
+
+def _refresh_duration(coordinator: SynologyHyperBackupCoordinator) -> float | None:
+    """Return the duration in seconds of the coordinator's last refresh."""
+    if (latency := coordinator.refresh_stats.last_latency) is None:
         return None
+    return round(latency, 2)
+
+
+@dataclass(frozen=True, kw_only=True)
+class SynologyDiagnosticSensorDescription(SensorEntityDescription):
+    """Describes a sensor about the integration's own requests to DSM."""
+
+    value_fn: Callable[[SynologyHyperBackupCoordinator], StateType]
+    attributes_fn: Callable[[SynologyHyperBackupCoordinator], dict] | None = None
+
+
+# Attached to the status coordinator, which refreshes most often
+API_DIAGNOSTIC_SENSORS: tuple[SynologyDiagnosticSensorDescription, ...] = (
+    SynologyDiagnosticSensorDescription(
+        key="api_requests",
+        name="API Requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: sum(_api_stats(c, "count").values()),
+        attributes_fn=lambda c: _api_stats(c, "count"),
+    ),
+    SynologyDiagnosticSensorDescription(
+        key="api_errors",
+        name="API Errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: sum(_api_stats(c, "failures").values()),
+        attributes_fn=lambda c: _api_stats(c, "failures"),
+    ),
+    SynologyDiagnosticSensorDescription(
+        key="api_received",
+        name="API Received",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        value_fn=lambda c: sum(_api_stats(c, "received_bytes").values()),
+    ),
+    SynologyDiagnosticSensorDescription(
+        key="api_latency",
+        name="API Latency",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_api_mean_latency,
+        attributes_fn=lambda c: {
+            endpoint: round(stats.mean_latency * 1000)
+            for endpoint, stats in c.api.stats.items()
+            if stats.mean_latency is not None
+        },
+    ),
+)
+
+
+def _refresh_duration_description(
+    key: str, name: str
+) -> SynologyDiagnosticSensorDescription:
+    """Describe the refresh duration sensor of a coordinator."""
+    return SynologyDiagnosticSensorDescription(
+        key=key,
+        name=name,
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=_refresh_duration,
+    )
+
+
+class SynologyDiagnosticSensor(
+    CoordinatorEntity[SynologyHyperBackupCoordinator], SensorEntity
+):
+    """Diagnostic sensor about the integration's own requests to DSM."""
+
+    entity_description: SynologyDiagnosticSensorDescription
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_has_entity_name = False
+
+    def __init__(
+        self,
+        description: SynologyDiagnosticSensorDescription,
+        coordinator: SynologyHyperBackupCoordinator,
+        config_entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{DOMAIN}_{config_entry.entry_id}_{description.key}"
+        self._attr_name = f"Hyper Backup: {description.name}"
+        if device_info := _device_info(config_entry):
+            self._attr_device_info = device_info
+
+    @property
+    def available(self) -> bool:
+        """Stats are available even while the NAS is not."""
+        return True
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the state of the sensor."""
+        return self.entity_description.value_fn(self.coordinator)
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Return the state attributes."""
+        if self.entity_description.attributes_fn is None:
+            return None
+        return self.entity_description.attributes_fn(self.coordinator)
+
+
+@callback
+def _async_remove_filtered_entities(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: SynologyTasksCoordinator
+) -> None:
+    """Remove registered sensors whose key is no longer allowed by the options."""
+    # Longest prefix first, so a task named "a b" wins over a task named "a".
+    prefixes = sorted(
+        (
+            _unique_id(task.get("name"), "")
+            for task in coordinator.data.get("task_list", [])
+        ),
+        key=len,
+        reverse=True,
+    )
+    entity_registry = er.async_get(hass)
+    for entity_entry in er.async_entries_for_config_entry(
+        entity_registry, entry.entry_id
+    ):
+        prefix = next(
+            (p for p in prefixes if entity_entry.unique_id.startswith(p)), None
+        )
+        if prefix is None:
+            continue
+        if not coordinator.key_filter(entity_entry.unique_id[len(prefix) :]):
+            entity_registry.async_remove(entity_entry.entity_id)
 
 
 async def async_setup_entry(
@@ -168,50 +388,96 @@ async def async_setup_entry(
 ) -> None:
     """Set up the Synology task sensors."""
     coordinator: SynologyTasksCoordinator = hass.data[DOMAIN][entry.entry_id][
-        "coordinator"
+        CONF_COORDINATOR
     ]
+    status_coordinator: SynologyTaskStatusCoordinator = hass.data[DOMAIN][
+        entry.entry_id
+    ][CONF_STATUS_COORDINATOR]
+
+    # Only a filter the user set can leave sensors of keys no longer allowed.
+    if CONF_INCLUDE_KEYS in entry.options or CONF_EXCLUDE_KEYS in entry.options:
+        _async_remove_filtered_entities(hass, entry, coordinator)
+
+    # Track existing entity IDs to avoid duplicates
+    existing_ids: set[str] = set()
+    # Coordinator shape versions the entities were last discovered from
+    seen_shapes: tuple[int, int] | None = None
 
     @callback
-    def _create_entities(tasks: list) -> list[SynologyTaskSensor]:
-        """Create sensor entities for the tasks."""
+    def _create_entities() -> list[SynologyTaskSensor]:
+        """Create sensor entities for task keys that have none yet."""
         entities: list[SynologyTaskSensor] = []
+        tasks = coordinator.data.get("task_list", [])
 
-        for task in tasks:
-            entities.extend(
-                SynologyTaskSensor(
-                    name=task.get("name"),
-                    key=key,
-                    task=task,
-                    coordinator=coordinator,
-                    config_entry=entry,
+        def _new_entities(
+            name: str, task: dict, tier: SynologyHyperBackupCoordinator
+        ) -> None:
+            for key in task:
+                if not tier.key_filter(key):
+                    continue
+                if (unique_id := _unique_id(name, key)) in existing_ids:
+                    continue
+                existing_ids.add(unique_id)
+                entities.append(
+                    SynologyTaskSensor(
+                        name=name,
+                        key=key,
+                        task=task,
+                        coordinator=tier,
+                        config_entry=entry,
+                    )
                 )
-                for key in task
-            )
-
-        return entities
 
-    task_list = coordinator.data.get("task_list", [])
-    initial_entities = _create_entities(task_list)
+        for task in tasks:
+            _new_entities(task.get("name"), task, coordinator)
 
-    # Create initial entities
-    async_add_entities(initial_entities)
+        # Status keys subscribe to the fast tier; the task name comes from the
+        # slow tier.
+        names = {task.get("task_id"): task.get("name") for task in tasks}
+        for task in status_coordinator.data.get("task_list", []):
+            if (name := names.get(task.get("task_id"))) is not None:
+                _new_entities(name, task, status_coordinator)
 
-    # Track existing entity IDs to avoid duplicates
-    existing_ids = {entity.unique_id for entity in initial_entities}
+        return entities
 
     @callback
     def _async_update_entities() -> None:
-        """Create new entities for new tasks."""
-        new_entities = []
-        current_tasks = coordinator.data.get("task_list", [])
-        current_entities = _create_entities(current_tasks)
+        """Create entities for new tasks and keys."""
+        nonlocal seen_shapes
+        shapes = (coordinator.shape_version, status_coordinator.shape_version)
+        if shapes == seen_shapes:
+            return
+        seen_shapes = shapes
+        if new_entities := _create_entities():
+            async_add_entities(new_entities)
 
-        for entity in current_entities:
-            if entity.unique_id not in existing_ids:
-                new_entities.append(entity)
-                existing_ids.add(entity.unique_id)
+    # Create initial entities
+    _async_update_entities()
 
-        if new_entities:
-            async_add_entities(new_entities)
+    async_add_entities(
+        [
+            *(
+                SynologyDiagnosticSensor(description, status_coordinator, entry)
+                for description in API_DIAGNOSTIC_SENSORS
+            ),
+            SynologyDiagnosticSensor(
+                _refresh_duration_description(
+                    "tasks_refresh_duration", "Tasks Refresh Duration"
+                ),
+                coordinator,
+                entry,
+            ),
+            SynologyDiagnosticSensor(
+                _refresh_duration_description(
+                    "status_refresh_duration", "Status Refresh Duration"
+                ),
+                status_coordinator,
+                entry,
+            ),
+        ]
+    )
 
-    coordinator.async_add_listener(_async_update_entities)
+    entry.async_on_unload(coordinator.async_add_listener(_async_update_entities))
+    entry.async_on_unload(
+        status_coordinator.async_add_listener(_async_update_entities)
+    )
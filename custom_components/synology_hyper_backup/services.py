@@ -0,0 +1,95 @@
+"""Services of the Synology Hyper Backup integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .api import (
+    ApiCall,
+    backup_task_cancel_call,
+    backup_task_run_call,
+    integrity_check_cancel_call,
+    integrity_check_run_call,
+)
+from .const import CONF_STATUS_COORDINATOR, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant, ServiceCall
+
+    from .coordinator import SynologyTaskStatusCoordinator
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_TASK_ID = "task_id"
+
+SERVICE_REFRESH_TASK = "refresh_task"
+SERVICE_START_BACKUP = "start_backup"
+SERVICE_CANCEL_BACKUP = "cancel_backup"
+SERVICE_START_INTEGRITY_CHECK = "start_integrity_check"
+SERVICE_CANCEL_INTEGRITY_CHECK = "cancel_integrity_check"
+
+# Services acting on a task, with the call each one makes
+TASK_ACTIONS: dict[str, Callable[[Any], ApiCall]] = {
+    SERVICE_START_BACKUP: backup_task_run_call,
+    SERVICE_CANCEL_BACKUP: backup_task_cancel_call,
+    SERVICE_START_INTEGRITY_CHECK: integrity_check_run_call,
+    SERVICE_CANCEL_INTEGRITY_CHECK: integrity_check_cancel_call,
+}
+
+TASK_SERVICE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Required(ATTR_TASK_ID): vol.Coerce(int),
+    }
+)
+
+
+def _get_task(
+    hass: HomeAssistant, call: ServiceCall
+) -> tuple[SynologyTaskStatusCoordinator, int]:
+    """Return the status coordinator and id of the task a call targets."""
+    entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+    if (entry_data := hass.data.get(DOMAIN, {}).get(entry_id)) is None:
+        raise ServiceValidationError(f"Config entry {entry_id} is not loaded")
+    coordinator: SynologyTaskStatusCoordinator = entry_data[CONF_STATUS_COORDINATOR]
+    task_id = call.data[ATTR_TASK_ID]
+    tasks_by_id = (coordinator.tasks_coordinator.data or {}).get("tasks_by_id", {})
+    if task_id not in tasks_by_id:
+        raise ServiceValidationError(f"Hyper Backup task {task_id} is not known")
+    return coordinator, task_id
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """
+    Register the services. Each one refreshes only the task it targets,
+    so sensors of other tasks are not written and no full poll is made.
+    """
+
+    async def _async_refresh_task(call: ServiceCall) -> None:
+        """Refresh the status and last result of a task."""
+        coordinator, task_id = _get_task(hass, call)
+        await coordinator.async_refresh_task(task_id)
+
+    async def _async_task_action(call: ServiceCall) -> None:
+        """Start or cancel a backup or integrity check, then refresh the task."""
+        coordinator, task_id = _get_task(hass, call)
+        try:
+            await coordinator.async_request(TASK_ACTIONS[call.service](task_id))
+        except Exception as err:
+            raise HomeAssistantError(
+                f"Hyper Backup task {task_id} {call.service} failed: {err}"
+            ) from err
+        await coordinator.async_refresh_task(task_id)
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH_TASK, _async_refresh_task, schema=TASK_SERVICE_SCHEMA
+    )
+    for service in TASK_ACTIONS:
+        hass.services.async_register(
+            DOMAIN, service, _async_task_action, schema=TASK_SERVICE_SCHEMA
+        )
@@ -1,25 +1,290 @@
+import bisect
+import fnmatch
+import re
+from collections import deque
 from datetime import datetime
 
 LOG_TIME_FORMAT = "%Y/%m/%d %H:%M:%S"
+LOG_TIME_PATTERN = re.compile(r"\d{4}/\d{2}/\d{2} \d{2}:\d{2}:\d{2}")
+LOG_TASK_TAG = re.compile(r"\[[^\]]*\]\[(?P<task>[^\]]*)\]")
+# Log events about a task starting, finishing or failing
+LOG_TASK_EVENT = re.compile(
+    r"\b(start|finish|complet|fail|cancel|abort|suspend)", re.IGNORECASE
+)
 
 
-def search_logs(log_list: list[dict], task_name: str) -> dict | None:
+def parse_log_time(entry: dict) -> datetime | None:
+    """Return the timestamp of a Hyper Backup log entry, if it can be parsed."""
+    try:
+        return datetime.strptime(entry["time"], LOG_TIME_FORMAT)
+    except Exception:
+        return None
+
+
+def is_numeric(value) -> bool:
+    """Check if a value is numeric or a numeric string."""
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    if isinstance(value, str):
+        try:
+            float(value)
+            return True
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+def coerce_numeric(value):
+    """Convert a value to int or float if possible."""
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    if isinstance(value, str):
+        try:
+            as_float = float(value)
+            return int(as_float) if as_float.is_integer() else as_float
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def index_logs(log_list: list[dict]) -> dict[str, dict]:
     """
-    Return the most recent log entry for the given task name.
-    Looks for events like "[Network][<task>] Backup integrity check is finished..."
+    Return the most recent log entry per task name in a single pass.
+    Parses events like "[Network][<task>] Backup integrity check is finished..."
+    Log times are fixed width, so they are compared as strings without parsing.
     """
-    matches = []
-    needle = f"][{task_name}]"
+    latest: dict[str, tuple[str, dict]] = {}
     for entry in log_list:
-        event = entry.get("event", "")
-        if needle not in event:
+        if not (match := LOG_TASK_TAG.match(entry.get("event", ""))):
             continue
-        try:
-            when = datetime.strptime(entry["time"], LOG_TIME_FORMAT)
-        except Exception:
+        when = entry.get("time")
+        if not isinstance(when, str) or not LOG_TIME_PATTERN.fullmatch(when):
             continue
-        matches.append((when, entry))
-    if not matches:
-        return None
-    matches.sort(key=lambda tup: tup[0], reverse=True)
-    return matches[0][1]
+        task_name = match.group("task")
+        if (current := latest.get(task_name)) is None or when > current[0]:
+            latest[task_name] = (when, entry)
+    return {task_name: entry for task_name, (_, entry) in latest.items()}
+
+
+class LogCursor:
+    """
+    Position of the newest Hyper Backup log entry already processed.
+    Log times only have a one second resolution, so the events logged at the
+    cursor time are remembered to tell them apart from new ones.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cursor; everything is new."""
+        self.time: datetime | None = None
+        self.events: set[str] = set()
+
+    def is_older(self, when: datetime) -> bool:
+        """Return True if a log time lies strictly before the cursor."""
+        return self.time is not None and when < self.time
+
+    def is_seen(self, entry: dict, when: datetime) -> bool:
+        """Return True if the entry was already processed."""
+        return self.is_older(when) or (
+            when == self.time and entry.get("event", "") in self.events
+        )
+
+    def advance(self, log_list: list[dict]) -> None:
+        """Move the cursor past the given log entries."""
+        for entry in log_list:
+            if (when := parse_log_time(entry)) is None or self.is_older(when):
+                continue
+            if when != self.time:
+                self.time = when
+                self.events = set()
+            self.events.add(entry.get("event", ""))
+
+
+def diff_tasks(old: dict, new: dict) -> dict:
+    """Return the keys whose value differs per task id between two task indexes."""
+    changed: dict = {}
+    for task_id in old.keys() | new.keys():
+        old_task = old.get(task_id, {})
+        new_task = new.get(task_id, {})
+        if old_task == new_task:
+            continue
+        changed[task_id] = {
+            key
+            for key in old_task.keys() | new_task.keys()
+            if key not in old_task
+            or key not in new_task
+            or old_task[key] != new_task[key]
+        }
+    return changed
+
+
+class KeyFilter:
+    """Glob based allowlist and denylist for task keys."""
+
+    def __init__(self, include: list[str], exclude: list[str]) -> None:
+        """Compile the patterns; an empty allowlist allows every key."""
+        self._include = include
+        self._exclude = exclude
+        self._include_re = self._compile(include)
+        self._exclude_re = self._compile(exclude)
+        self._cache: dict[str, bool] = {}
+
+    @staticmethod
+    def _compile(patterns: list[str]) -> re.Pattern | None:
+        if not patterns:
+            return None
+        return re.compile("|".join(fnmatch.translate(pattern) for pattern in patterns))
+
+    def __call__(self, key: str) -> bool:
+        """Return True if sensors should be created for the key."""
+        if (allowed := self._cache.get(key)) is None:
+            allowed = (
+                self._include_re is None or bool(self._include_re.match(key))
+            ) and (self._exclude_re is None or not self._exclude_re.match(key))
+            self._cache[key] = allowed
+        return allowed
+
+    def allows_prefix(self, prefix: str) -> bool:
+        """Return True if any key starting with the prefix may be allowed."""
+        if f"{prefix}*" in self._exclude or "*" in self._exclude:
+            return False
+        if not self._include:
+            return True
+        for pattern in self._include:
+            literal = re.split(r"[*?\[]", pattern, maxsplit=1)[0]
+            if literal.startswith(prefix) or prefix.startswith(literal):
+                return True
+        return False
+
+
+class TaskBackoff:
+    """Exponential retry backoff for tasks whose updates keep failing."""
+
+    def __init__(self, base: float, maximum: float) -> None:
+        """Initialize with the first and the longest retry delay in seconds."""
+        self._base = base
+        self._maximum = maximum
+        # task id -> (consecutive failures, monotonic time of the next retry)
+        self._failures: dict = {}
+
+    def is_due(self, task_id, now: float) -> bool:
+        """Return True if the task may be fetched at the given time."""
+        return (failure := self._failures.get(task_id)) is None or now >= failure[1]
+
+    def failed(self, task_id, now: float) -> float:
+        """Record a failure and return the delay until the next retry."""
+        count = self._failures.get(task_id, (0, 0))[0] + 1
+        delay = min(self._base * 2 ** (count - 1), self._maximum)
+        self._failures[task_id] = (count, now + delay)
+        return delay
+
+    def succeeded(self, task_id) -> None:
+        """Reset the backoff of a task after a successful fetch."""
+        self._failures.pop(task_id, None)
+
+    def retain(self, task_ids) -> None:
+        """Forget the tasks that no longer exist."""
+        for task_id in self._failures.keys() - set(task_ids):
+            del self._failures[task_id]
+
+
+class LatencyStats:
+    """Count, failures, received bytes and latency histogram of requests."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """Initialize empty stats with the histogram bucket bounds in seconds."""
+        self._buckets = buckets
+        self.count = 0
+        self.failures = 0
+        self.received_bytes = 0
+        self.total_latency = 0.0
+        self.max_latency = 0.0
+        self.last_latency: float | None = None
+        # One counter per bucket upper bound, plus one for anything slower
+        self.histogram = [0] * (len(buckets) + 1)
+
+    def record(
+        self, latency: float | None, size: int = 0, failed: bool = False
+    ) -> None:
+        """Record a request; latency is None when it was not timed on its own."""
+        self.count += 1
+        self.failures += failed
+        self.received_bytes += size
+        if latency is None:
+            return
+        self.last_latency = latency
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.histogram[bisect.bisect_left(self._buckets, latency)] += 1
+
+    @property
+    def mean_latency(self) -> float | None:
+        """Return the mean latency of the timed requests in seconds."""
+        timed = sum(self.histogram)
+        return self.total_latency / timed if timed else None
+
+    def as_dict(self) -> dict:
+        """Return the stats as a JSON serializable dict."""
+        mean_latency = self.mean_latency
+        return {
+            "count": self.count,
+            "failures": self.failures,
+            "received_bytes": self.received_bytes,
+            "mean_latency": None if mean_latency is None else round(mean_latency, 3),
+            "max_latency": round(self.max_latency, 3),
+            "last_latency": (
+                None if self.last_latency is None else round(self.last_latency, 3)
+            ),
+            "histogram": {
+                **{
+                    f"le_{bound}": count
+                    for bound, count in zip(self._buckets, self.histogram)
+                },
+                "inf": self.histogram[-1],
+            },
+        }
+
+
+class ProgressWindow:
+    """
+    Fixed-size window of timestamped progress samples of one task run.
+    Each sample is (monotonic time, processed bytes, transmitted bytes).
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize an empty window keeping the newest size samples."""
+        self._samples: deque[tuple[float, float, float]] = deque(maxlen=size)
+
+    def add(self, when: float, processed: float, transmitted: float) -> None:
+        """Add a sample; shrinking counters mean a new run, so start over."""
+        if self._samples and (
+            processed < self._samples[-1][1] or transmitted < self._samples[-1][2]
+        ):
+            self._samples.clear()
+        self._samples.append((when, processed, transmitted))
+
+    def _rate(self, first: int, index: int) -> float | None:
+        """Return the bytes per second of a counter from a sample to the newest."""
+        if len(self._samples) < 2:
+            return None
+        start, end = self._samples[first], self._samples[-1]
+        if (elapsed := end[0] - start[0]) <= 0:
+            return None
+        return (end[index] - start[index]) / elapsed
+
+    def transfer_rate(self) -> float | None:
+        """Return the transfer rate between the two newest samples."""
+        return self._rate(-2, 2)
+
+    def average_transfer_rate(self) -> float | None:
+        """Return the transfer rate over the whole window."""
+        return self._rate(0, 2)
+
+    def eta(self, total: float) -> float | None:
+        """Return the seconds left to process total bytes at the window's rate."""
+        if not (rate := self._rate(0, 1)) or rate <= 0:
+            return None
+        return max(total - self._samples[-1][1], 0) / rate
@@ -0,0 +1 @@
+"""Tests for the Synology Hyper Backup integration."""
@@ -0,0 +1 @@
+"""Benchmarks of the Synology Hyper Backup integration."""
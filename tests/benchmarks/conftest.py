@@ -0,0 +1,136 @@
+"""Fixtures for the Synology Hyper Backup benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import tracemalloc
+from collections.abc import AsyncGenerator, Callable
+from typing import Any
+
+import pytest
+
+from custom_components.synology_hyper_backup.const import (
+    CONF_COORDINATOR,
+    CONF_STATUS_COORDINATOR,
+    DOMAIN,
+    FLEET_MAX_CONCURRENT_REQUESTS,
+)
+from custom_components.synology_hyper_backup.coordinator import (
+    SynologyTaskStatusCoordinator,
+    SynologyTasksCoordinator,
+)
+from custom_components.synology_hyper_backup.scheduler import FleetScheduler
+
+from ..fake_dsm import FakeDsm, FakeTransportApi, build_fleet
+
+# A benchmark target returns a coroutine to be run on the event loop, or the
+# result of synchronous work.
+Target = Callable[..., Any]
+
+
+@pytest.fixture
+def latency() -> float:
+    """Return the seconds the fake DSM takes to answer a request."""
+    return 0.0
+
+
+@pytest.fixture
+def dsm(latency: float) -> FakeDsm:
+    """Return an in-memory NAS answering after the latency."""
+    return FakeDsm(latency=latency)
+
+
+@pytest.fixture
+def transport_api(dsm: FakeDsm) -> FakeTransportApi:
+    """Return a client calling into the in-memory NAS without HTTP."""
+    return FakeTransportApi(dsm)
+
+
+@pytest.fixture
+def tasks() -> int:
+    """Return the number of tasks of the simulated fleet."""
+    return 50
+
+
+@pytest.fixture
+async def coordinators(
+    hass, config_entry, dsm: FakeDsm, transport_api: FakeTransportApi, tasks: int
+) -> AsyncGenerator[
+    tuple[SynologyTasksCoordinator, SynologyTaskStatusCoordinator], None
+]:
+    """
+    Return both coordinators of a fleet of tasks, refreshed once and
+    registered in hass.data like a loaded config entry.
+    """
+    build_fleet(dsm, tasks, 100)
+    tasks_coordinator = SynologyTasksCoordinator(
+        hass,
+        config_entry,
+        transport_api,
+        FleetScheduler(FLEET_MAX_CONCURRENT_REQUESTS, 0),
+    )
+    await tasks_coordinator.async_refresh()
+    status_coordinator = SynologyTaskStatusCoordinator(
+        hass, config_entry, tasks_coordinator
+    )
+    await status_coordinator.async_refresh()
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = {
+        CONF_COORDINATOR: tasks_coordinator,
+        CONF_STATUS_COORDINATOR: status_coordinator,
+    }
+    yield tasks_coordinator, status_coordinator
+    await tasks_coordinator.async_shutdown()
+    await status_coordinator.async_shutdown()
+
+
+@pytest.fixture
+def measure(benchmark, hass):
+    """
+    Return a function benchmarking a target on the event loop of hass.
+    Besides the wall time measured by pytest-benchmark, the CPU time the
+    event loop's thread spent per round is recorded as loop_cpu_time, and
+    the memory allocated by one extra traced round as alloc_peak and
+    alloc_retained (in bytes) in the benchmark's extra_info. setup returns
+    the arguments of the target and runs before every round, untimed.
+    """
+
+    def _run(target: Target, args: tuple) -> Any:
+        result = target(*args)
+        if asyncio.iscoroutine(result):
+            result = hass.loop.run_until_complete(result)
+        return result
+
+    def _measure(
+        target: Target,
+        setup: Callable[[], tuple] | None = None,
+        rounds: int = 5,
+    ) -> Any:
+        def _setup() -> tuple[tuple, dict]:
+            return (setup() if setup else ()), {}
+
+        cpu_times: list[float] = []
+
+        def _timed(*args: Any) -> Any:
+            start = time.thread_time()
+            result = _run(target, args)
+            cpu_times.append(time.thread_time() - start)
+            return result
+
+        result = benchmark.pedantic(_timed, setup=_setup, rounds=rounds)
+        if benchmark.disabled:
+            return result
+
+        benchmark.extra_info["loop_cpu_time"] = sum(cpu_times) / len(cpu_times)
+        args = _setup()[0]
+        tracemalloc.start()
+        try:
+            _run(target, args)
+            retained, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["alloc_peak"] = peak
+        benchmark.extra_info["alloc_retained"] = retained
+        return result
+
+    return _measure
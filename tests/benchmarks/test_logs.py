@@ -0,0 +1,75 @@
+"""Benchmarks of indexing the Hyper Backup log by task."""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from custom_components.synology_hyper_backup.utils import LOG_TIME_FORMAT, index_logs
+
+from ..fake_dsm import FakeDsm, build_fleet
+
+
+def _search_logs(log_list: list[dict], task_name: str) -> dict | None:
+    """The per-task lookup index_logs replaced, kept as the baseline."""
+    matches = []
+    needle = f"][{task_name}]"
+    for entry in log_list:
+        event = entry.get("event", "")
+        if needle not in event:
+            continue
+        try:
+            when = datetime.strptime(entry["time"], LOG_TIME_FORMAT)
+        except Exception:
+            continue
+        matches.append((when, entry))
+    if not matches:
+        return None
+    matches.sort(key=lambda tup: tup[0], reverse=True)
+    return matches[0][1]
+
+
+def _latest_by_search(log_list: list[dict], task_names: list[str]) -> dict:
+    """Look up the latest log row of every task with one scan per task."""
+    return {
+        task_name: entry
+        for task_name in task_names
+        if (entry := _search_logs(log_list, task_name)) is not None
+    }
+
+
+def _latest_by_index(log_list: list[dict], task_names: list[str]) -> dict:
+    """Look up the latest log row of every task in an index built once."""
+    latest = index_logs(log_list)
+    return {
+        task_name: latest[task_name] for task_name in task_names if task_name in latest
+    }
+
+
+@pytest.mark.parametrize("log_rows", [100, 1000, 10000])
+@pytest.mark.parametrize("tasks", [1, 50, 200])
+def test_index_logs(measure, tasks: int, log_rows: int) -> None:
+    """Latest log row per task, in one pass over the log."""
+    dsm = FakeDsm()
+    build_fleet(dsm, tasks, log_rows)
+
+    latest = measure(index_logs, setup=lambda: (dsm.logs,), rounds=20)
+
+    assert len(latest) == min(tasks, -(-log_rows // 3))
+
+
+@pytest.mark.benchmark(group="latest log row per task, 100 tasks, 1000 rows")
+@pytest.mark.parametrize(
+    "lookup", [_latest_by_search, _latest_by_index], ids=["search_logs", "index_logs"]
+)
+def test_latest_log_per_task(measure, lookup) -> None:
+    """The single pass index against one search of the log per task."""
+    dsm = FakeDsm()
+    build_fleet(dsm, 100, 1000)
+    task_names = [task["name"] for task in dsm.tasks.values()]
+
+    latest = measure(lookup, setup=lambda: (dsm.logs, task_names), rounds=10)
+
+    assert latest == _latest_by_search(dsm.logs, task_names)
+    assert len(latest) == 100
@@ -0,0 +1,101 @@
+"""Benchmarks of the coordinator refreshes against a simulated fleet."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.synology_hyper_backup.const import FLEET_MAX_CONCURRENT_REQUESTS
+from custom_components.synology_hyper_backup.coordinator import (
+    SynologyTaskStatusCoordinator,
+    SynologyTasksCoordinator,
+)
+from custom_components.synology_hyper_backup.scheduler import FleetScheduler
+
+from ..fake_dsm import FakeDsm, FakeTransportApi, build_fleet
+
+TASKS = (1, 50, 200)
+LOG_ROWS = (100, 1000, 10000)
+
+
+def _tasks_coordinator(hass, config_entry, api) -> SynologyTasksCoordinator:
+    """Return a slow tier coordinator that has not refreshed yet."""
+    return SynologyTasksCoordinator(
+        hass, config_entry, api, FleetScheduler(FLEET_MAX_CONCURRENT_REQUESTS, 0)
+    )
+
+
+async def _async_refresh(
+    coordinator: SynologyTasksCoordinator,
+) -> SynologyTasksCoordinator:
+    """Refresh a coordinator and return it."""
+    await coordinator.async_refresh()
+    return coordinator
+
+
+@pytest.mark.parametrize("log_rows", LOG_ROWS)
+@pytest.mark.parametrize("tasks", TASKS)
+def test_tasks_first_refresh(
+    hass,
+    config_entry,
+    dsm: FakeDsm,
+    transport_api: FakeTransportApi,
+    measure,
+    tasks: int,
+    log_rows: int,
+) -> None:
+    """First slow tier refresh, walking every integrity check log row."""
+    build_fleet(dsm, tasks, log_rows)
+
+    coordinator = measure(
+        _async_refresh,
+        setup=lambda: (_tasks_coordinator(hass, config_entry, transport_api),),
+    )
+
+    assert coordinator.last_update_success
+    # Every third log row is an integrity check, spread over the tasks.
+    assert sum(
+        "integrity_check_time" in task for task in coordinator.data["task_list"]
+    ) == min(tasks, log_rows // 3)
+
+
+@pytest.mark.parametrize("latency", [0.0, 0.01])
+@pytest.mark.parametrize("tasks", TASKS)
+def test_tasks_refresh(
+    hass,
+    config_entry,
+    dsm: FakeDsm,
+    transport_api: FakeTransportApi,
+    measure,
+    tasks: int,
+) -> None:
+    """Steady state slow tier refresh, with no new log rows."""
+    build_fleet(dsm, tasks, 1000)
+    coordinator = _tasks_coordinator(hass, config_entry, transport_api)
+    hass.loop.run_until_complete(coordinator.async_refresh())
+
+    measure(coordinator.async_refresh)
+
+    assert coordinator.last_update_success
+    assert len(coordinator.data["task_list"]) == tasks
+
+
+@pytest.mark.parametrize("latency", [0.0, 0.01])
+@pytest.mark.parametrize("tasks", TASKS)
+def test_status_refresh(
+    hass,
+    config_entry,
+    dsm: FakeDsm,
+    transport_api: FakeTransportApi,
+    measure,
+    tasks: int,
+) -> None:
+    """Fast tier refresh of every task's status."""
+    build_fleet(dsm, tasks, 100)
+    tasks_coordinator = _tasks_coordinator(hass, config_entry, transport_api)
+    hass.loop.run_until_complete(tasks_coordinator.async_refresh())
+    coordinator = SynologyTaskStatusCoordinator(hass, config_entry, tasks_coordinator)
+
+    measure(coordinator.async_refresh)
+
+    assert coordinator.last_update_success
+    assert len(coordinator.data["task_list"]) == tasks
@@ -0,0 +1,121 @@
+"""Benchmarks of the sensor platform."""
+
+from __future__ import annotations
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockEntityPlatform
+
+from custom_components.synology_hyper_backup.const import DOMAIN
+from custom_components.synology_hyper_backup.sensor import (
+    SynologyTaskSensor,
+    async_setup_entry,
+)
+
+TASKS = (1, 50, 200)
+
+
+def _get_task_by_scan(self: SynologyTaskSensor) -> dict | None:
+    """The linear task lookup the task_id index replaced, kept as the baseline."""
+    if not self.coordinator.data:
+        return None
+    return next(
+        (
+            task
+            for task in self.coordinator.data.get("task_list")
+            if task.get("task_id") == self.task.get("task_id")
+        ),
+        None,
+    )
+
+
+def _changed(value):
+    """Return a different value of the same type."""
+    if isinstance(value, bool):
+        return not value
+    if isinstance(value, (int, float)):
+        return value + 1
+    if isinstance(value, str):
+        return value[:-1] if value.endswith("'") else f"{value}'"
+    return value
+
+
+async def _async_create_entities(hass, config_entry) -> list:
+    """Set up the sensor platform and return the entities it adds."""
+    entities: list = []
+    await async_setup_entry(
+        hass,
+        config_entry,
+        lambda new_entities, update_before_add=False: entities.extend(new_entities),
+    )
+    return entities
+
+
+@pytest.mark.parametrize("tasks", TASKS)
+def test_create_entities(hass, config_entry, coordinators, measure, tasks: int) -> None:
+    """Creating the sensors of every task key."""
+    entities = measure(_async_create_entities, setup=lambda: (hass, config_entry))
+
+    task_sensors = [e for e in entities if isinstance(e, SynologyTaskSensor)]
+    assert len({sensor.task["task_id"] for sensor in task_sensors}) == tasks
+
+
+@pytest.mark.parametrize("tasks", TASKS)
+def test_read_sensors(
+    hass, config_entry, coordinators, measure, tasks: int
+) -> None:
+    """Reading the state and attributes of every task sensor."""
+    sensors = [
+        entity
+        for entity in hass.loop.run_until_complete(
+            _async_create_entities(hass, config_entry)
+        )
+        if isinstance(entity, SynologyTaskSensor)
+    ]
+
+    def _read() -> list:
+        return [
+            (sensor.native_value, sensor.extra_state_attributes, sensor.available)
+            for sensor in sensors
+        ]
+
+    states = measure(_read, rounds=50)
+
+    assert len(states) == len(sensors)
+
+
+@pytest.mark.benchmark(group="state writes, 50 tasks")
+@pytest.mark.parametrize("lookup", ["index", "scan"])
+def test_write_states(
+    hass, config_entry, coordinators, measure, monkeypatch, lookup: str
+) -> None:
+    """Writing the state of every task sensor after every task value changed."""
+    if lookup == "scan":
+        monkeypatch.setattr(SynologyTaskSensor, "_get_task", _get_task_by_scan)
+    entities = hass.loop.run_until_complete(_async_create_entities(hass, config_entry))
+    platform = MockEntityPlatform(hass, domain="sensor", platform_name=DOMAIN)
+    hass.loop.run_until_complete(platform.async_add_entities(entities))
+
+    def _setup() -> tuple:
+        # Every value but the task's identity changes, so every sensor writes.
+        return tuple(
+            {
+                "task_list": [
+                    {
+                        key: value if key in ("task_id", "name") else _changed(value)
+                        for key, value in task.items()
+                    }
+                    for task in coordinator.data["task_list"]
+                ]
+            }
+            for coordinator in coordinators
+        )
+
+    async def _async_write(*data: dict) -> None:
+        for coordinator, coordinator_data in zip(coordinators, data):
+            coordinator.async_set_updated_data(coordinator._publish(coordinator_data))
+
+    measure(_async_write, setup=_setup, rounds=20)
+
+    sensor = next(e for e in entities if isinstance(e, SynologyTaskSensor))
+    assert hass.states.get(sensor.entity_id).state == str(sensor.native_value)
+    hass.loop.run_until_complete(platform.async_reset())
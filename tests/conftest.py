@@ -0,0 +1,103 @@
+"""Fixtures for the Synology Hyper Backup tests."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestServer
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.synology_hyper_backup.api import SynologyHyperBackupApi
+from custom_components.synology_hyper_backup.const import (
+    CONFIG_DEVICE_NAME,
+    CONFIG_DSM_ENTRY_ID,
+    DOMAIN,
+    FLEET_MAX_CONCURRENT_REQUESTS,
+)
+from custom_components.synology_hyper_backup.coordinator import (
+    SynologyTaskStatusCoordinator,
+    SynologyTasksCoordinator,
+)
+from custom_components.synology_hyper_backup.scheduler import FleetScheduler
+
+from .fake_dsm import PASSWORD, USERNAME, FakeDsm
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable custom integrations in all tests."""
+    return
+
+
+@pytest.fixture
+async def fake_dsm(socket_enabled: None) -> AsyncGenerator[FakeDsm, None]:
+    """Serve a fake DSM web API on a local port."""
+    dsm = FakeDsm()
+    server = TestServer(dsm.app(), host="127.0.0.1")
+    await server.start_server()
+    dsm.port = server.port
+    yield dsm
+    await server.close()
+
+
+@pytest.fixture
+async def session() -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """
+    Return an HTTP session closed after the test. Connections are not kept
+    alive, as the fake DSM closes idle ones when a test moves time forward.
+    """
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(force_close=True)
+    ) as session:
+        yield session
+
+
+@pytest.fixture
+def api(fake_dsm: FakeDsm, session: aiohttp.ClientSession) -> SynologyHyperBackupApi:
+    """Return a client of the fake DSM logging in with its own session."""
+    return SynologyHyperBackupApi(
+        session, "127.0.0.1", fake_dsm.port, USERNAME, PASSWORD, secure=False
+    )
+
+
+@pytest.fixture
+def options() -> dict:
+    """Return the options of the config entry."""
+    return {}
+
+
+@pytest.fixture
+def config_entry(hass, options: dict) -> MockConfigEntry:
+    """Return a config entry of the integration added to hass."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="NAS",
+        data={CONFIG_DSM_ENTRY_ID: "dsm", CONFIG_DEVICE_NAME: "NAS"},
+        options=options,
+    )
+    entry.add_to_hass(hass)
+    return entry
+
+
+@pytest.fixture
+async def tasks_coordinator(
+    hass, config_entry: MockConfigEntry, api: SynologyHyperBackupApi
+) -> AsyncGenerator[SynologyTasksCoordinator, None]:
+    """Return the slow tier coordinator of the config entry."""
+    coordinator = SynologyTasksCoordinator(
+        hass, config_entry, api, FleetScheduler(FLEET_MAX_CONCURRENT_REQUESTS, 0)
+    )
+    yield coordinator
+    await coordinator.async_shutdown()
+
+
+@pytest.fixture
+async def status_coordinator(
+    hass, config_entry: MockConfigEntry, tasks_coordinator: SynologyTasksCoordinator
+) -> AsyncGenerator[SynologyTaskStatusCoordinator, None]:
+    """Return the fast tier coordinator of the config entry."""
+    coordinator = SynologyTaskStatusCoordinator(hass, config_entry, tasks_coordinator)
+    yield coordinator
+    await coordinator.async_shutdown()
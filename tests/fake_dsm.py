@@ -0,0 +1,300 @@
+"""Fake DSM web API serving the endpoints used by the integration."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+from datetime import datetime, timedelta
+from typing import Any
+
+from aiohttp import web
+
+from custom_components.synology_hyper_backup.api import SynologyHyperBackupApi
+
+USERNAME = "admin"
+PASSWORD = "secret"
+
+API_INFO = "SYNO.API.Info"
+API_AUTH = "SYNO.API.Auth"
+API_BACKUP_TASK = "SYNO.Backup.Task"
+API_BACKUP_TARGET = "SYNO.Backup.Target"
+API_BACKUP_LOG = "SYNO.SDS.Backup.Client.Common.Log"
+API_ENTRY_REQUEST = "SYNO.Entry.Request"
+
+ERROR_UNKNOWN_METHOD = 103
+ERROR_TASK_FAILED = 4401
+ERROR_INVALID_PARAMETER = 120
+ERROR_BAD_LOGIN = 400
+
+LOG_TIME_FORMAT = "%Y/%m/%d %H:%M:%S"
+INTEGRITY_CHECK_FINISHED = "Backup integrity check is finished. No error was found."
+
+
+# Parameters DSM reads as other than strings, with their type
+TYPED_PARAMS: dict[str, type] = {
+    "task_id": int,
+    "limit": int,
+    "offset": int,
+    "blOnline": bool,
+    "additional": list,
+    "detect_data": bool,
+}
+
+
+def _params(params: dict[str, Any]) -> dict[str, str]:
+    """Return request parameters as the strings DSM receives them as."""
+    return {
+        key: value if isinstance(value, str) else json.dumps(value)
+        for key, value in params.items()
+    }
+
+
+def _decode(value: str) -> Any:
+    """Decode a query or form value the way DSM does: as JSON, if it is."""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+class FakeDsm:
+    """
+    In-memory NAS with Hyper Backup tasks and a Hyper Backup log.
+    Every API method call is recorded in calls, including the calls carried
+    by SYNO.Entry.Request; http_requests counts the HTTP round trips.
+    """
+
+    def __init__(self, latency: float = 0.0, compound: bool = True) -> None:
+        """Initialize an empty NAS answering after latency seconds."""
+        self.latency = latency
+        self.compound = compound
+        # Port of the HTTP server, once served
+        self.port: int | None = None
+        self.tasks: dict[int, dict] = {}
+        self.statuses: dict[int, dict] = {}
+        self.results: dict[int, dict] = {}
+        # Newest first, like the log list of DSM
+        self.logs: list[dict] = []
+        self.sessions: set[str] = set()
+        # Error code returned for a session id DSM does not know
+        self.session_error = 119
+        self.failing_task_ids: set[int] = set()
+        self.calls: list[tuple[str, str]] = []
+        self.actions: list[tuple[str, int]] = []
+        self.http_requests = 0
+        # Log rows returned by log list calls
+        self.log_rows_sent = 0
+        self.logins = 0
+        self.logouts = 0
+        self._sids = itertools.count(1)
+
+    def add_task(self, task_id: int, name: str, status: str = "none") -> None:
+        """Add a Hyper Backup task."""
+        self.tasks[task_id] = {
+            "task_id": task_id,
+            "name": name,
+            "state": "backupable",
+            "target_type": "network",
+            "transfer_type": "rsync",
+        }
+        self.statuses[task_id] = {
+            "task_id": task_id,
+            "state": "backupable",
+            "status": status,
+            "progress": {
+                "progress": 0,
+                "processed_size": 0,
+                "transmitted_size": 0,
+                "total_size": 0,
+            },
+        }
+        self.results[task_id] = {
+            "task_id": task_id,
+            "last_bkp_time": "2026/10/17 03:00",
+            "next_bkp_time": "2026/10/18 03:00",
+            "last_bkp_result": "done",
+            "is_modified": False,
+            "last_bkp_progress": {"transmitted_size": 1024},
+        }
+
+    def add_log(self, when: str, event: str) -> None:
+        """Log an event; it becomes the newest row of the log."""
+        self.logs.insert(0, {"time": when, "event": event, "level": "info"})
+
+    def login(self) -> str:
+        """Open a session, as another DSM client would, and return its id."""
+        sid = f"sid{next(self._sids)}"
+        self.sessions.add(sid)
+        return sid
+
+    def expire_sessions(self) -> None:
+        """Drop every session, as DSM does after a timeout or restart."""
+        self.sessions.clear()
+
+    def handle(self, params: dict[str, str]) -> dict:
+        """
+        Answer one HTTP request given its query or form parameters.
+        The calls of a compound request are already JSON, so their values
+        are taken as they are rather than decoded once more.
+        """
+        self.http_requests += 1
+        params = {key: _decode(value) for key, value in params.items()}
+        if params.get("api") != API_ENTRY_REQUEST:
+            return self._call(params)
+        self.calls.append((API_ENTRY_REQUEST, params.get("method", "")))
+        if params.get("_sid") not in self.sessions:
+            return {"success": False, "error": {"code": self.session_error}}
+        results = []
+        for call in params["compound"]:
+            payload = self._call({**call, "_sid": params["_sid"]})
+            results.append(
+                {"api": call["api"], "method": call["method"], **payload}
+            )
+        return {
+            "success": True,
+            "data": {
+                "has_fail": any(not result["success"] for result in results),
+                "result": results,
+            },
+        }
+
+    def _call(self, params: dict[str, Any]) -> dict:
+        """Answer one API method call."""
+        api, method = params.get("api", ""), params.get("method", "")
+        self.calls.append((api, method))
+        if api == API_INFO:
+            return {"success": True, "data": self._api_info()}
+        if api == API_AUTH:
+            return self._auth(method, params)
+        if params.get("_sid") not in self.sessions:
+            return {"success": False, "error": {"code": self.session_error}}
+
+        if any(
+            key in params and not isinstance(params[key], kind)
+            for key, kind in TYPED_PARAMS.items()
+        ):
+            return {"success": False, "error": {"code": ERROR_INVALID_PARAMETER}}
+        task_id = params.get("task_id")
+        if task_id is not None and task_id not in self.tasks:
+            return {"success": False, "error": {"code": ERROR_TASK_FAILED}}
+        if api == API_BACKUP_TASK and method == "list":
+            tasks = list(self.tasks.values())
+            return {"success": True, "data": {"task_list": tasks, "total": len(tasks)}}
+        if api == API_BACKUP_TASK and method == "status":
+            if task_id in self.failing_task_ids:
+                return {"success": False, "error": {"code": ERROR_TASK_FAILED}}
+            if "additional" in params:
+                return {"success": True, "data": self.results[task_id]}
+            return {"success": True, "data": self.statuses[task_id]}
+        if api == API_BACKUP_LOG and method == "list":
+            return {"success": True, "data": self._log_page(params)}
+        if (api, method) in (
+            (API_BACKUP_TASK, "backup"),
+            (API_BACKUP_TASK, "cancel"),
+            (API_BACKUP_TARGET, "error_detect"),
+            (API_BACKUP_TARGET, "error_detect_cancel"),
+        ):
+            self.actions.append((method, task_id))
+            return {"success": True}
+        return {"success": False, "error": {"code": ERROR_UNKNOWN_METHOD}}
+
+    def _api_info(self) -> dict:
+        """Return the path and versions of the APIs this NAS offers."""
+        apis = [API_AUTH, API_BACKUP_TASK, API_BACKUP_TARGET, API_BACKUP_LOG]
+        if self.compound:
+            apis.append(API_ENTRY_REQUEST)
+        return {
+            api: {"path": "entry.cgi", "minVersion": 1, "maxVersion": 2}
+            for api in apis
+        }
+
+    def _auth(self, method: str, params: dict[str, Any]) -> dict:
+        """Log in or out."""
+        if method == "login":
+            if (params.get("account"), params.get("passwd")) != (USERNAME, PASSWORD):
+                return {"success": False, "error": {"code": ERROR_BAD_LOGIN}}
+            self.logins += 1
+            return {
+                "success": True,
+                "data": {"sid": self.login(), "synotoken": "token"},
+            }
+        if method == "logout":
+            self.logouts += 1
+            self.sessions.discard(params.get("_sid"))
+            return {"success": True}
+        return {"success": False, "error": {"code": ERROR_UNKNOWN_METHOD}}
+
+    def _log_page(self, params: dict[str, Any]) -> dict:
+        """Return a page of the log rows containing the filter keyword."""
+        keyword = str(params.get("filter_keyword", ""))
+        rows = [row for row in self.logs if keyword in row["event"]]
+        offset = params.get("offset", 0)
+        limit = params.get("limit", 1000)
+        page = rows[offset : offset + limit]
+        self.log_rows_sent += len(page)
+        return {"log_list": page, "total": len(rows)}
+
+    async def _async_handle_http(self, request: web.Request) -> web.Response:
+        """Answer a GET or POST request to a DSM CGI."""
+        params = dict(request.query)
+        if request.method == "POST":
+            params.update(await request.post())
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.json_response(self.handle(params))
+
+    def app(self) -> web.Application:
+        """Return the web application serving /webapi/."""
+        app = web.Application()
+        app.router.add_route("*", "/webapi/{cgi}", self._async_handle_http)
+        return app
+
+
+class FakeTransportApi(SynologyHyperBackupApi):
+    """
+    The integration's client with the HTTP transport replaced by direct
+    calls into a FakeDsm, so only the client's own work runs on the loop.
+    Payloads still go through JSON, as they would on the wire.
+    """
+
+    def __init__(self, dsm: FakeDsm) -> None:
+        """Initialize a client of the given NAS."""
+        super().__init__(None, "nas.local", 5001, USERNAME, PASSWORD)
+        self._dsm = dsm
+
+    async def _async_send(self, method: str, path: str, **kwargs: Any) -> dict:
+        """Answer a request from the FakeDsm after its latency."""
+        request = kwargs.get("params") or kwargs.get("data") or {}
+        if self._dsm.latency:
+            await asyncio.sleep(self._dsm.latency)
+        body = json.dumps(self._dsm.handle(_params(request))).encode()
+        payload = json.loads(body)
+        self._record(
+            f"{request.get('api')}.{request.get('method')}",
+            None,
+            len(body),
+            failed=not payload.get("success"),
+        )
+        return payload
+
+
+def build_fleet(dsm: FakeDsm, tasks: int, log_rows: int) -> None:
+    """
+    Add tasks named "Task <n>" and log rows spread over them, cycling
+    through the start, end and integrity check events of their runs.
+    """
+    for task_id in range(1, tasks + 1):
+        dsm.add_task(task_id, f"Task {task_id}")
+    events = (
+        "Backup task started.",
+        "Backup task finished successfully. [1.5 GB transferred]",
+        INTEGRITY_CHECK_FINISHED,
+    )
+    start = datetime(2026, 1, 1)
+    for row in range(log_rows):
+        task_id = row // len(events) % tasks + 1
+        dsm.add_log(
+            (start + timedelta(minutes=row)).strftime(LOG_TIME_FORMAT),
+            f"[Network][Task {task_id}] {events[row % len(events)]}",
+        )
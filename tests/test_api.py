@@ -0,0 +1,210 @@
+"""Tests for the Hyper Backup web API client against a fake DSM."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.synology_hyper_backup.api import (
+    SynologyApiError,
+    SynologyAuthError,
+    SynologyHyperBackupApi,
+    backup_task_list_call,
+    backup_task_result_call,
+    backup_task_status_call,
+    hb_logs_get_call,
+    integrity_check_run_call,
+)
+
+from .fake_dsm import (
+    API_BACKUP_LOG,
+    API_BACKUP_TASK,
+    API_ENTRY_REQUEST,
+    ERROR_TASK_FAILED,
+    PASSWORD,
+    USERNAME,
+    FakeDsm,
+)
+
+
+async def test_task_endpoints(fake_dsm: FakeDsm, api: SynologyHyperBackupApi) -> None:
+    """The task list, status and last result keep the payload shapes of DSM."""
+    fake_dsm.add_task(1, "Daily", status="backup")
+
+    tasks = await api.async_backup_task_list()
+    status = await api.async_backup_task_status(1)
+    result = await api.async_backup_task_result(1)
+
+    assert tasks["success"]
+    assert [task["name"] for task in tasks["data"]["task_list"]] == ["Daily"]
+    assert status["data"]["status"] == "backup"
+    assert status["data"]["progress"]["total_size"] == 0
+    assert result["data"]["last_bkp_result"] == "done"
+    assert fake_dsm.logins == 1
+
+
+async def test_log_list(fake_dsm: FakeDsm, api: SynologyHyperBackupApi) -> None:
+    """Log rows are filtered by keyword and paged newest first."""
+    for minute in range(5):
+        fake_dsm.add_log(f"2026/10/17 10:0{minute}:00", f"[Network][A] Event {minute}")
+    fake_dsm.add_log("2026/10/17 11:00:00", "[Network][B] Other")
+
+    page = await api.async_hb_logs_get(limit=2, offset=1, filter_keyword="Event")
+
+    assert [row["event"] for row in page["data"]["log_list"]] == [
+        "[Network][A] Event 3",
+        "[Network][A] Event 2",
+    ]
+    assert page["data"]["total"] == 5
+
+
+async def test_api_error(fake_dsm: FakeDsm, api: SynologyHyperBackupApi) -> None:
+    """DSM errors raise SynologyApiError with their code."""
+    fake_dsm.add_task(1, "Daily")
+    fake_dsm.failing_task_ids.add(1)
+
+    with pytest.raises(SynologyApiError) as err:
+        await api.async_backup_task_status(1)
+
+    assert err.value.api == API_BACKUP_TASK
+    assert err.value.code == ERROR_TASK_FAILED
+    assert api.stats[f"{API_BACKUP_TASK}.status"].failures == 1
+
+
+async def test_bad_credentials(fake_dsm: FakeDsm, session) -> None:
+    """A rejected login raises SynologyAuthError."""
+    api = SynologyHyperBackupApi(
+        session, "127.0.0.1", fake_dsm.port, USERNAME, "wrong", secure=False
+    )
+
+    with pytest.raises(SynologyAuthError):
+        await api.async_backup_task_list()
+
+
+async def test_logout(fake_dsm: FakeDsm, api: SynologyHyperBackupApi) -> None:
+    """Logging out ends our session once."""
+    await api.async_backup_task_list()
+    assert fake_dsm.sessions
+
+    await api.async_logout()
+    await api.async_logout()
+
+    assert not fake_dsm.sessions
+    assert fake_dsm.logouts == 1
+
+
+async def test_compound_request(fake_dsm: FakeDsm, api: SynologyHyperBackupApi) -> None:
+    """A SYNO.Entry.Request batch is split back into one payload per call."""
+    fake_dsm.add_task(1, "Daily")
+    fake_dsm.add_task(2, "Weekly")
+    fake_dsm.failing_task_ids.add(2)
+    fake_dsm.add_log("2026/10/17 10:00:00", "[Network][Daily] Backup task started.")
+    await api.async_login()
+    http_requests = fake_dsm.http_requests
+
+    payloads = await api.async_request_compound(
+        [
+            backup_task_list_call(),
+            backup_task_result_call(1),
+            backup_task_status_call(2),
+            hb_logs_get_call(10),
+        ]
+    )
+
+    assert fake_dsm.http_requests == http_requests + 1
+    assert [payload["success"] for payload in payloads] == [True, True, False, True]
+    assert len(payloads[0]["data"]["task_list"]) == 2
+    assert payloads[1]["data"]["last_bkp_result"] == "done"
+    assert payloads[2]["error"]["code"] == ERROR_TASK_FAILED
+    assert payloads[3]["data"]["log_list"][0]["event"].endswith("started.")
+    assert api.stats[f"{API_BACKUP_TASK}.status"].count == 2
+    assert api.stats[f"{API_BACKUP_TASK}.status"].failures == 1
+    assert api.stats[f"{API_BACKUP_LOG}.list"].count == 1
+    assert api.stats[f"{API_ENTRY_REQUEST}.request"].count == 1
+
+
+async def test_compound_request_native_values(
+    fake_dsm: FakeDsm, api: SynologyHyperBackupApi
+) -> None:
+    """Calls in a compound request carry numbers, booleans and arrays as such."""
+    fake_dsm.add_task(1, "Daily")
+    await api.async_login()
+
+    payloads = await api.async_request_compound(
+        [
+            backup_task_result_call(1),
+            integrity_check_run_call(1),
+            hb_logs_get_call(10, offset=5),
+        ]
+    )
+
+    assert all(payload["success"] for payload in payloads)
+    assert fake_dsm.actions == [("error_detect", 1)]
+
+
+async def test_compound_not_supported(session) -> None:
+    """supports_compound follows the APIs DSM reports."""
+    dsm = FakeDsm(compound=False)
+    api = SynologyHyperBackupApi(session, "127.0.0.1", 1, USERNAME, PASSWORD)
+    api._apis = dsm._api_info()
+
+    assert not api.supports_compound
+
+
+@pytest.mark.parametrize("code", [106, 107, 119])
+async def test_relogin_after_session_error(
+    fake_dsm: FakeDsm, api: SynologyHyperBackupApi, code: int
+) -> None:
+    """An expired session is replaced by a new login and the call retried."""
+    fake_dsm.add_task(1, "Daily")
+    fake_dsm.session_error = code
+    await api.async_backup_task_list()
+    fake_dsm.expire_sessions()
+
+    status = await api.async_backup_task_status(1)
+
+    assert status["success"]
+    assert fake_dsm.logins == 2
+
+
+@pytest.mark.parametrize("code", [106, 107, 119])
+async def test_compound_relogin_after_session_error(
+    fake_dsm: FakeDsm, api: SynologyHyperBackupApi, code: int
+) -> None:
+    """A compound request is retried once its session was replaced."""
+    fake_dsm.add_task(1, "Daily")
+    fake_dsm.session_error = code
+    await api.async_login()
+    fake_dsm.expire_sessions()
+
+    payloads = await api.async_request_compound(
+        [backup_task_list_call(), backup_task_status_call(1)]
+    )
+
+    assert all(payload["success"] for payload in payloads)
+    assert fake_dsm.logins == 2
+
+
+async def test_borrowed_session(fake_dsm: FakeDsm, session) -> None:
+    """A borrowed session is used until DSM rejects it, and not logged out."""
+    fake_dsm.add_task(1, "Daily")
+    borrowed = fake_dsm.login()
+    api = SynologyHyperBackupApi(
+        session,
+        "127.0.0.1",
+        fake_dsm.port,
+        USERNAME,
+        PASSWORD,
+        secure=False,
+        session_provider=lambda: (borrowed, None),
+    )
+
+    await api.async_backup_task_list()
+    assert fake_dsm.logins == 0
+    await api.async_logout()
+    assert borrowed in fake_dsm.sessions
+
+    fake_dsm.expire_sessions()
+    await api.async_backup_task_status(1)
+    assert fake_dsm.logins == 1
+    await api.async_logout()
+    assert fake_dsm.logouts == 1
@@ -0,0 +1,18 @@
+"""Tests for the Synology Hyper Backup config flow."""
+
+from __future__ import annotations
+
+from custom_components.synology_hyper_backup.config_flow import OPTIONS_SCHEMA
+from custom_components.synology_hyper_backup.const import (
+    CONF_EXCLUDE_KEYS,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    DEFAULT_MAX_CONCURRENT_REQUESTS,
+)
+
+
+def test_options_defaults() -> None:
+    """Options left out of the form get their defaults."""
+    options = OPTIONS_SCHEMA({})
+
+    assert options[CONF_MAX_CONCURRENT_REQUESTS] == DEFAULT_MAX_CONCURRENT_REQUESTS
+    assert options[CONF_EXCLUDE_KEYS] == []
@@ -0,0 +1,124 @@
+"""Tests for the Hyper Backup coordinators."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.synology_hyper_backup.const import LOG_FIRST_PAGE_SIZE
+from custom_components.synology_hyper_backup.coordinator import (
+    SynologyTaskStatusCoordinator,
+    SynologyTasksCoordinator,
+)
+
+from .fake_dsm import (
+    API_BACKUP_TASK,
+    INTEGRITY_CHECK_FINISHED,
+    FakeDsm,
+    build_fleet,
+)
+
+
+async def test_integrity_checks_merged(
+    fake_dsm: FakeDsm, tasks_coordinator: SynologyTasksCoordinator
+) -> None:
+    """The latest integrity check of each task is merged onto it."""
+    fake_dsm.add_task(1, "Daily")
+    fake_dsm.add_task(2, "Weekly")
+    fake_dsm.add_log(
+        "2026/10/16 04:00:00", f"[Network][Daily] {INTEGRITY_CHECK_FINISHED}"
+    )
+    fake_dsm.add_log(
+        "2026/10/17 04:00:00", f"[Network][Daily] {INTEGRITY_CHECK_FINISHED}"
+    )
+
+    await tasks_coordinator.async_refresh()
+
+    assert tasks_coordinator.last_update_success
+    tasks_by_id = tasks_coordinator.data["tasks_by_id"]
+    assert tasks_by_id[1]["integrity_check_time"] == "2026/10/17 04:00:00"
+    assert "integrity_check_time" not in tasks_by_id[2]
+
+    fake_dsm.add_log(
+        "2026/10/17 05:00:00", f"[Network][Weekly] {INTEGRITY_CHECK_FINISHED}"
+    )
+    await tasks_coordinator.async_refresh_task(2)
+
+    tasks_by_id = tasks_coordinator.data["tasks_by_id"]
+    assert tasks_by_id[2]["integrity_check_time"] == "2026/10/17 05:00:00"
+    assert tasks_by_id[1]["integrity_check_time"] == "2026/10/17 04:00:00"
+
+
+async def test_log_tail_after_empty_log(
+    fake_dsm: FakeDsm,
+    tasks_coordinator: SynologyTasksCoordinator,
+    status_coordinator: SynologyTaskStatusCoordinator,
+) -> None:
+    """A run logged after an initially empty log refreshes its task."""
+    fake_dsm.add_task(1, "Daily")
+    await tasks_coordinator.async_refresh()
+    await status_coordinator.async_refresh()
+
+    await status_coordinator.async_check_log_tail()
+    fake_dsm.statuses[1]["status"] = "backup"
+    fake_dsm.add_log("2026/10/17 10:00:00", "[Network][Daily] Backup task started.")
+    await status_coordinator.async_check_log_tail()
+
+    assert status_coordinator.data["tasks_by_id"][1]["status_status"] == "backup"
+
+
+async def test_integrity_logs_fetch_new_rows_only(
+    fake_dsm: FakeDsm, tasks_coordinator: SynologyTasksCoordinator
+) -> None:
+    """Once the log was read, polls fetch the new rows, not a full page."""
+    build_fleet(fake_dsm, 10, 3000)
+    await tasks_coordinator.async_refresh()
+
+    log_rows_sent = fake_dsm.log_rows_sent
+    await tasks_coordinator.async_refresh()
+    assert fake_dsm.log_rows_sent - log_rows_sent == LOG_FIRST_PAGE_SIZE
+
+    # More new rows than the first page are fetched in growing pages.
+    for minute in range(50):
+        fake_dsm.add_log(
+            f"2026/02/01 10:{minute:02}:00",
+            f"[Network][Task {minute % 10 + 1}] {INTEGRITY_CHECK_FINISHED}",
+        )
+    log_rows_sent = fake_dsm.log_rows_sent
+    await tasks_coordinator.async_refresh()
+
+    assert fake_dsm.log_rows_sent - log_rows_sent < 200
+    tasks_by_id = tasks_coordinator.data["tasks_by_id"]
+    assert tasks_by_id[1]["integrity_check_time"] == "2026/02/01 10:40:00"
+    assert tasks_by_id[10]["integrity_check_time"] == "2026/02/01 10:49:00"
+
+
+async def test_refresh_task_keeps_full_poll_scheduled(
+    hass,
+    freezer: FrozenDateTimeFactory,
+    fake_dsm: FakeDsm,
+    tasks_coordinator: SynologyTasksCoordinator,
+    status_coordinator: SynologyTaskStatusCoordinator,
+) -> None:
+    """Refreshing one task does not postpone the full polls of either tier."""
+    fake_dsm.add_task(1, "Daily")
+    fake_dsm.add_task(2, "Weekly")
+    tasks_coordinator.async_add_listener(lambda: None)
+    status_coordinator.async_add_listener(lambda: None)
+    await tasks_coordinator.async_refresh()
+    await status_coordinator.async_refresh()
+
+    freezer.tick(timedelta(seconds=200))
+    await status_coordinator.async_refresh_task(1)
+    calls = len(fake_dsm.calls)
+    task_lists = fake_dsm.calls.count((API_BACKUP_TASK, "list"))
+
+    freezer.tick(timedelta(seconds=110))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    # Both tiers polled every task at their original time.
+    assert fake_dsm.calls.count((API_BACKUP_TASK, "list")) == task_lists + 1
+    assert fake_dsm.calls[calls:].count((API_BACKUP_TASK, "status")) >= 4
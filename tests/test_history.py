@@ -0,0 +1,36 @@
+"""Tests for the import of past backup runs."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from custom_components.synology_hyper_backup.history import BackupHistoryImporter
+
+
+def _log(when: str, task: str, message: str) -> dict:
+    """Return a Hyper Backup log row."""
+    return {"time": when, "event": f"[Network][{task}] {message}", "level": "info"}
+
+
+async def test_collect_runs_sizes_from_message(hass, config_entry) -> None:
+    """Data sizes are read from the message, not from the task name."""
+    importer = BackupHistoryImporter(hass, config_entry, None)
+    # Newest first, like the log list of DSM
+    task = "2TB offsite"
+    log_list = [
+        _log("2026/10/17 05:30:00", task, "Backup task finished successfully."),
+        _log("2026/10/17 05:00:00", task, "Backup task started."),
+        _log(
+            "2026/10/17 03:30:00",
+            task,
+            "Backup task finished successfully. [1.5 GB transferred]",
+        ),
+        _log("2026/10/17 03:00:00", task, "Backup task started."),
+    ]
+
+    runs = importer._collect_runs(log_list, datetime(2027, 1, 1, tzinfo=timezone.utc))
+
+    hours = sorted(runs[task].items())
+    assert [hour_runs.transferred for _, hour_runs in hours] == [1.5 * 1024**3, None]
+    assert [hour_runs.durations for _, hour_runs in hours] == [[1800.0], [1800.0]]
+    assert [hour_runs.succeeded for _, hour_runs in hours] == [1, 1]
@@ -0,0 +1,35 @@
+"""Tests for the setup of the Synology Hyper Backup integration."""
+
+from __future__ import annotations
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.synology_hyper_backup import async_migrate_entry
+from custom_components.synology_hyper_backup.const import (
+    CONF_EXCLUDE_KEYS,
+    CONF_INCLUDE_KEYS,
+    DOMAIN,
+)
+
+
+async def test_migrate_keeps_every_key(hass) -> None:
+    """Entries from before the key allowlist keep a sensor for every key."""
+    entry = MockConfigEntry(domain=DOMAIN, version=1, options={})
+    entry.add_to_hass(hass)
+
+    assert await async_migrate_entry(hass, entry)
+
+    assert entry.version == 2
+    assert entry.options == {CONF_INCLUDE_KEYS: ["*"]}
+
+
+async def test_migrate_keeps_options(hass) -> None:
+    """Key filters already set by the user are kept."""
+    options = {CONF_INCLUDE_KEYS: ["status_*"], CONF_EXCLUDE_KEYS: ["status_state"]}
+    entry = MockConfigEntry(domain=DOMAIN, version=1, options=options)
+    entry.add_to_hass(hass)
+
+    assert await async_migrate_entry(hass, entry)
+
+    assert entry.version == 2
+    assert entry.options == options
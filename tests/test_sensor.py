@@ -0,0 +1,123 @@
+"""Tests for the Synology Hyper Backup sensors."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockEntityPlatform
+
+from custom_components.synology_hyper_backup.const import (
+    CONF_COORDINATOR,
+    CONF_INCLUDE_KEYS,
+    CONF_STATUS_COORDINATOR,
+    DOMAIN,
+)
+from custom_components.synology_hyper_backup.coordinator import (
+    SynologyTaskStatusCoordinator,
+    SynologyTasksCoordinator,
+)
+from custom_components.synology_hyper_backup.sensor import (
+    SynologyTaskSensor,
+    async_setup_entry,
+)
+
+from .fake_dsm import FakeDsm
+
+
+async def _async_setup_sensors(
+    hass,
+    config_entry,
+    tasks_coordinator: SynologyTasksCoordinator,
+    status_coordinator: SynologyTaskStatusCoordinator,
+) -> list:
+    """Refresh the coordinators, set up the sensors and return them."""
+    await tasks_coordinator.async_refresh()
+    await status_coordinator.async_refresh()
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = {
+        CONF_COORDINATOR: tasks_coordinator,
+        CONF_STATUS_COORDINATOR: status_coordinator,
+    }
+    entities: list = []
+    await async_setup_entry(
+        hass,
+        config_entry,
+        lambda new_entities, update_before_add=False: entities.extend(new_entities),
+    )
+    return entities
+
+
+def _register_sensor(hass, config_entry, unique_id: str) -> str:
+    """Register a sensor of the config entry and return its entity id."""
+    return (
+        er.async_get(hass)
+        .async_get_or_create("sensor", DOMAIN, unique_id, config_entry=config_entry)
+        .entity_id
+    )
+
+
+@pytest.mark.parametrize(
+    ("options", "removed"),
+    [({}, False), ({CONF_INCLUDE_KEYS: ["name", "status_*"]}, True)],
+)
+async def test_remove_filtered_entities(
+    hass,
+    config_entry,
+    fake_dsm: FakeDsm,
+    tasks_coordinator: SynologyTasksCoordinator,
+    status_coordinator: SynologyTaskStatusCoordinator,
+    removed: bool,
+) -> None:
+    """Sensors of keys no longer allowed are removed only by a user's filter."""
+    fake_dsm.add_task(1, "Daily")
+    entity_id = _register_sensor(hass, config_entry, "daily_transfer_type")
+
+    await _async_setup_sensors(
+        hass, config_entry, tasks_coordinator, status_coordinator
+    )
+
+    assert (er.async_get(hass).async_get(entity_id) is None) == removed
+
+
+async def test_initial_state_is_current(
+    hass,
+    config_entry,
+    fake_dsm: FakeDsm,
+    tasks_coordinator: SynologyTasksCoordinator,
+    status_coordinator: SynologyTaskStatusCoordinator,
+) -> None:
+    """A sensor added after a refresh writes the refreshed value."""
+    fake_dsm.add_task(1, "Daily")
+    entities = await _async_setup_sensors(
+        hass, config_entry, tasks_coordinator, status_coordinator
+    )
+    sensor = next(
+        entity
+        for entity in entities
+        if isinstance(entity, SynologyTaskSensor) and entity.key == "status_status"
+    )
+    fake_dsm.statuses[1]["status"] = "backup"
+    await status_coordinator.async_refresh()
+
+    platform = MockEntityPlatform(hass, domain="sensor", platform_name=DOMAIN)
+    await platform.async_add_entities([sensor])
+
+    assert hass.states.get(sensor.entity_id).state == "backup"
+    await platform.async_reset()
+
+
+async def test_task_id_attribute(
+    hass,
+    config_entry,
+    fake_dsm: FakeDsm,
+    tasks_coordinator: SynologyTasksCoordinator,
+    status_coordinator: SynologyTaskStatusCoordinator,
+) -> None:
+    """Every task sensor tells the task_id the services take."""
+    fake_dsm.add_task(7, "Daily")
+    entities = await _async_setup_sensors(
+        hass, config_entry, tasks_coordinator, status_coordinator
+    )
+
+    sensors = [e for e in entities if isinstance(e, SynologyTaskSensor)]
+    assert sensors
+    assert all(sensor.extra_state_attributes["task_id"] == 7 for sensor in sensors)
@@ -0,0 +1,67 @@
+"""Tests for the Synology Hyper Backup services."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from freezegun.api import FrozenDateTimeFactory
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.synology_hyper_backup.const import (
+    CONF_COORDINATOR,
+    CONF_STATUS_COORDINATOR,
+    DOMAIN,
+)
+from custom_components.synology_hyper_backup.coordinator import (
+    SynologyTaskStatusCoordinator,
+    SynologyTasksCoordinator,
+)
+from custom_components.synology_hyper_backup.services import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_TASK_ID,
+    SERVICE_START_BACKUP,
+    async_setup_services,
+)
+
+from .fake_dsm import API_BACKUP_TASK, FakeDsm
+
+
+async def test_task_service_keeps_full_poll_scheduled(
+    hass,
+    freezer: FrozenDateTimeFactory,
+    fake_dsm: FakeDsm,
+    config_entry: MockConfigEntry,
+    tasks_coordinator: SynologyTasksCoordinator,
+    status_coordinator: SynologyTaskStatusCoordinator,
+) -> None:
+    """A service call refreshes its task without postponing the full polls."""
+    fake_dsm.add_task(1, "Daily")
+    fake_dsm.add_task(2, "Weekly")
+    tasks_coordinator.async_add_listener(lambda: None)
+    status_coordinator.async_add_listener(lambda: None)
+    await tasks_coordinator.async_refresh()
+    await status_coordinator.async_refresh()
+    hass.data.setdefault(DOMAIN, {})[config_entry.entry_id] = {
+        CONF_COORDINATOR: tasks_coordinator,
+        CONF_STATUS_COORDINATOR: status_coordinator,
+    }
+    async_setup_services(hass)
+
+    freezer.tick(timedelta(seconds=200))
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_START_BACKUP,
+        {ATTR_CONFIG_ENTRY_ID: config_entry.entry_id, ATTR_TASK_ID: 1},
+        blocking=True,
+    )
+    assert fake_dsm.actions == [("backup", 1)]
+    task_lists = fake_dsm.calls.count((API_BACKUP_TASK, "list"))
+
+    freezer.tick(timedelta(seconds=110))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert fake_dsm.calls.count((API_BACKUP_TASK, "list")) == task_lists + 1